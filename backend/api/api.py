@@ -5,10 +5,14 @@ Application bootstrap that wires reporting and meter logging routers.
 
 from __future__ import annotations
 
+import hashlib
 import sys
+from contextlib import asynccontextmanager
 from pathlib import Path
 
-from fastapi import FastAPI
+import orjson
+from fastapi import FastAPI, Request, Response
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 
 # Ensure backend package is importable when run as script
@@ -27,37 +31,60 @@ except ImportError:
 from .api_reporting import reporting_router
 from .api_meter_logging import meter_router
 from .api_user_management import user_router
+from .api_helpers import ORJSONResponse, shutdown_report_executor
 from backend.middleware.auth_middleware import AuthMiddleware
+from backend.services.data.db_manager.pool import close_all_pools
+
+# Allowed browser origins. A frozenset keeps CORSMiddleware's per-request
+# origin check a hash lookup instead of a linear scan of a list.
+ALLOWED_ORIGINS = frozenset({
+    "http://localhost:3000",
+    "http://127.0.0.1:3000",
+    "http://localhost:3001",
+    "http://52.221.59.184",  # AWS server IP (HTTP)
+    "http://52.221.59.184:3000",  # If frontend runs on same server (HTTP)
+    "http://52.221.59.184:8000",  # Direct API access (HTTP)
+    "https://52.221.59.184",  # AWS server IP (HTTPS via nginx)
+    "https://stratcon.facets-ai.com",  # Production domain (HTTPS)
+    # Add more origins as needed for demo
+})
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # Stop the report process pool, then release the pooled SQLite handles
+    # (cancelled jobs are marked failed through the pool). The shutdown waits
+    # for running reports, so it runs in the threadpool to keep the event loop free.
+    await run_in_threadpool(shutdown_report_executor)
+    close_all_pools()
+
 
 app = FastAPI(
     title="Electricity Report Generation API",
     description="API for generating electricity consumption reports and manual meter logs.",
     version="1.0.0",
+    # Encode every JSON body with orjson rather than the stdlib json module.
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
-# Add CORS middleware first (runs last, wraps everything to ensure CORS headers on all responses)
-# Register authentication middleware first (it should run inside CORS so that
-# CORS headers are still applied even when auth rejects a request).
+# Middleware added last is the outermost layer. Register authentication first
+# so it runs inside CORS: preflights are answered by CORSMiddleware without
+# ever reaching AuthMiddleware, and CORS headers are still applied when auth
+# rejects a request.
 app.add_middleware(AuthMiddleware)
 
 # CORS middleware must be added last so it wraps every response, including
 # those generated inside other middleware like AuthMiddleware.
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=[
-        "http://localhost:3000",
-        "http://127.0.0.1:3000",
-        "http://localhost:3001",
-        "http://52.221.59.184",  # AWS server IP (HTTP)
-        "http://52.221.59.184:3000",  # If frontend runs on same server (HTTP)
-        "http://52.221.59.184:8000",  # Direct API access (HTTP)
-        "https://52.221.59.184",  # AWS server IP (HTTPS via nginx)
-        "https://stratcon.facets-ai.com",  # Production domain (HTTPS)
-        # Add more origins as needed for demo
-    ],
+    allow_origins=ALLOWED_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
+    allow_headers=["Authorization", "Content-Type", "X-User-Id", "X-UserId"],
+    # Let browsers cache preflight responses for 24h instead of re-sending
+    # OPTIONS before almost every cross-origin POST/PUT/DELETE.
+    max_age=86400,
 )
 
 app.include_router(reporting_router)
@@ -65,53 +92,86 @@ app.include_router(meter_router)
 app.include_router(user_router)
 
 
+# The endpoint index is static between deploys: build and serialize it once.
+_ROOT_INFO = {
+    "message": "Electricity Report Generation API",
+    "version": "1.0.0",
+    "endpoints": {
+        # Reporting API endpoints
+        "GET /clients": "List accessible clients for the authenticated user",
+        "GET /buildings": "List buildings for a client (user-scoped)",
+        "GET /tenants": "List tenants for a client (user-scoped)",
+        "POST /reports/tenant": "Generate reports for a specific tenant",
+        "POST /reports/client": "Generate reports for all tenants under a client",
+        "POST /reports/generate_last_records": "Generate and email the last records CSV for a client",
+        "POST /reports/generate_billing_info": "Generate and email the billing info CSV for a client",
+        "POST /settings/client": "Update client settings (cutoff day/time)",
+        "POST /settings/tenant": "Update tenant settings (cutoff day/time)",
+        "GET /settings/client/{client_token}": "Get all settings for a client",
+        "GET /settings/cutoff": "Get cutoff datetime settings for a client/tenant/load",
+        
+        # Meter Logging API endpoints
+        "GET /meters/v1/buildings": "Get buildings assigned to a user (requires user_id query param)",
+        "GET /meters/v1/buildings/{building_id}/tenants": "Get tenants for a specific building",
+        "GET /meters/v1/tenants": "List tenants available for manual meter logging (requires client_id query param)",
+        "GET /meters/v1/tenants/{tenant_id}/floors": "Get distinct floors for a tenant",
+        "GET /meters/v1/tenants/{tenant_id}/meters": "List meters assigned to a tenant (optional floor filter)",
+        "POST /meters/v1/records": "Submit manual meter readings (bulk-friendly)",
+        "POST /meters/v1/approvals": "Attach approval (name/signature) to a meter record session",
+        "GET /meters/v1/meter-records": "Get meter record history (filter by tenant_id or meter_id)",
+        "GET /meters/v1/user-id": "Get user ID from email address",
+        "GET /meters/v1/user-info": "Get user information (ID, role, entity_id) from email address",
+        "GET /meters/v1/meta": "Get meter logging API metadata (version, server time, etc.)",
+        
+        # User Management API endpoints
+        "GET /settings/users": "List all users (requires SUPER_ADMIN or CLIENT_ADMIN)",
+        "GET /settings/users/{user_id}": "Get a specific user by ID (requires SUPER_ADMIN or CLIENT_ADMIN)",
+        "POST /settings/users": "Create a new user (requires SUPER_ADMIN or CLIENT_ADMIN)",
+        "PUT /settings/users/{user_id}": "Update an existing user (requires SUPER_ADMIN or CLIENT_ADMIN)",
+        "DELETE /settings/users/{user_id}": "Delete a user (soft delete, requires SUPER_ADMIN)",
+        "GET /settings/users/roles": "Get all available roles and their permissions",
+        "GET /settings/users/roles/{role_name}": "Get information about a specific role",
+    },
+}
+_ROOT_PAYLOAD = orjson.dumps(_ROOT_INFO)
+_ROOT_ETAG = f'"{hashlib.sha1(_ROOT_PAYLOAD).hexdigest()}"'
+_ROOT_HEADERS = {"ETag": _ROOT_ETAG, "Cache-Control": "public, max-age=3600"}
+
+
 @app.get("/")
-async def root():
+async def root(request: Request):
     """Root endpoint providing API information."""
-    return {
-        "message": "Electricity Report Generation API",
-        "version": "1.0.0",
-        "endpoints": {
-            # Reporting API endpoints
-            "GET /clients": "List accessible clients for the authenticated user",
-            "GET /buildings": "List buildings for a client (user-scoped)",
-            "GET /tenants": "List tenants for a client (user-scoped)",
-            "POST /reports/tenant": "Generate reports for a specific tenant",
-            "POST /reports/client": "Generate reports for all tenants under a client",
-            "POST /reports/generate_last_records": "Generate and email the last records CSV for a client",
-            "POST /reports/generate_billing_info": "Generate and email the billing info CSV for a client",
-            "POST /settings/client": "Update client settings (cutoff day/time)",
-            "POST /settings/tenant": "Update tenant settings (cutoff day/time)",
-            "GET /settings/client/{client_token}": "Get all settings for a client",
-            "GET /settings/cutoff": "Get cutoff datetime settings for a client/tenant/load",
-            
-            # Meter Logging API endpoints
-            "GET /meters/v1/buildings": "Get buildings assigned to a user (requires user_id query param)",
-            "GET /meters/v1/buildings/{building_id}/tenants": "Get tenants for a specific building",
-            "GET /meters/v1/tenants": "List tenants available for manual meter logging (requires client_id query param)",
-            "GET /meters/v1/tenants/{tenant_id}/floors": "Get distinct floors for a tenant",
-            "GET /meters/v1/tenants/{tenant_id}/meters": "List meters assigned to a tenant (optional floor filter)",
-            "POST /meters/v1/records": "Submit manual meter readings (bulk-friendly)",
-            "POST /meters/v1/approvals": "Attach approval (name/signature) to a meter record session",
-            "GET /meters/v1/meter-records": "Get meter record history (filter by tenant_id or meter_id)",
-            "GET /meters/v1/user-id": "Get user ID from email address",
-            "GET /meters/v1/user-info": "Get user information (ID, role, entity_id) from email address",
-            "GET /meters/v1/meta": "Get meter logging API metadata (version, server time, etc.)",
-            
-            # User Management API endpoints
-            "GET /settings/users": "List all users (requires SUPER_ADMIN or CLIENT_ADMIN)",
-            "GET /settings/users/{user_id}": "Get a specific user by ID (requires SUPER_ADMIN or CLIENT_ADMIN)",
-            "POST /settings/users": "Create a new user (requires SUPER_ADMIN or CLIENT_ADMIN)",
-            "PUT /settings/users/{user_id}": "Update an existing user (requires SUPER_ADMIN or CLIENT_ADMIN)",
-            "DELETE /settings/users/{user_id}": "Delete a user (soft delete, requires SUPER_ADMIN)",
-            "GET /settings/users/roles": "Get all available roles and their permissions",
-            "GET /settings/users/roles/{role_name}": "Get information about a specific role",
-        },
-    }
+    if request.headers.get("if-none-match") == _ROOT_ETAG:
+        return Response(status_code=304, headers=_ROOT_HEADERS)
+    return Response(content=_ROOT_PAYLOAD, media_type="application/json", headers=_ROOT_HEADERS)
 
 
 if __name__ == "__main__":
+    import os
+
     import uvicorn
-    
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+
+    # uvloop is only available on Linux/macOS; fall back to asyncio elsewhere.
+    loop = "uvloop" if sys.platform != "win32" else "asyncio"
+    try:
+        import uvloop  # noqa: F401
+    except ImportError:
+        loop = "asyncio"
+
+    # Each worker is a separate process with its own TTL caches (user scope,
+    # lookups); that is acceptable because the TTLs are short.
+    default_workers = (os.cpu_count() or 1) * 2 + 1
+    uvicorn.run(
+        "backend.api.api:app",
+        host="0.0.0.0",
+        port=8000,
+        loop=loop,
+        http="httptools",
+        workers=int(os.getenv("WEB_CONCURRENCY", default_workers)),
+        backlog=2048,
+        limit_concurrency=1000,
+        # The frontend polls /clients, /buildings, /tenants; keep idle
+        # connections open long enough to be reused between polls.
+        timeout_keep_alive=30,
+    )
 
@@ -3,59 +3,141 @@
 
 from __future__ import annotations
 
+import hashlib
+import math
+import multiprocessing
 import os
+import re
+import uuid
+from concurrent.futures import Future, ProcessPoolExecutor
 from pathlib import Path
 from dataclasses import dataclass
+from functools import lru_cache
 from datetime import datetime
-from typing import Any, Dict, List, Optional, cast
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, cast
 
-from fastapi import HTTPException, Request, status
+import orjson
+from fastapi import HTTPException, Request, Response, status
+from fastapi.responses import JSONResponse
 
+from backend.middleware.auth_middleware import _header_user_id
+from backend.services.core.cache import TTLCache
 from backend.services.core.config import DEFAULT_CLIENT
 from backend.services.core.utils import ReportLogger
-from backend.services.data.db_manager import DbQueries, MeterLoggingDbQueries, ReportingDbQueries
-from backend.services.domain.reporting import generate_report_for_tenant_artifacts
-from backend.services.services.email import send_report_email
+from backend.services.data.db_manager import (
+    DbQueries,
+    MeterLoggingDbQueries,
+    ReportingDbQueries,
+    db_connection,
+)
 
 # Environment variable for auth bypass
 AUTH_BYPASS_SCOPE = os.getenv("AUTH_BYPASS_SCOPE", "true").strip().lower() in {"1", "true", "yes"}
 
+# Process-local caches for user scope lookups. Assignments change rarely, so a
+# short TTL keeps repeated requests from hitting the database every time.
+_USER_INFO_CACHE = TTLCache(maxsize=4096, ttl=60)
+_TENANT_CLIENT_CACHE = TTLCache(maxsize=4096, ttl=60)
+# Login lookups (/meters/v1/user-id, /user-info) keyed by email.
+_USER_BY_EMAIL_CACHE = TTLCache(maxsize=4096, ttl=60)
+# Client / tenant token resolution for the reporting endpoints.
+_CLIENT_BY_TOKEN_CACHE = TTLCache(maxsize=1024, ttl=60)
+_TENANT_BY_TOKEN_CACHE = TTLCache(maxsize=4096, ttl=60)
+# Active building ids for a (frozen) set of scope tenants.
+_TENANT_BUILDINGS_CACHE = TTLCache(maxsize=4096, ttl=60)
+# Meter identifiers map to an almost static set of primary keys.
+_METER_PK_CACHE = TTLCache(maxsize=8192, ttl=300)
+
+# Report generation is CPU-bound (pandas/plotly), so it runs in a dedicated
+# process pool instead of the API worker's threadpool / event loop. Every
+# uvicorn worker owns its own pool, so keep the per-worker size small.
+REPORT_WORKERS = max(1, int(os.getenv("REPORT_WORKERS", "2")))
+_REPORT_EXECUTOR: Optional[ProcessPoolExecutor] = None
+
 
 # ============================================================================
 # Data Models
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class UserScope:
-    """User scope information for reporting API."""
+    """User scope information for reporting API (immutable and hashable)."""
     user_id: Optional[int]
-    epc_ids: List[int]
-    client_ids: List[int]
-    tenant_ids: List[int]
+    epc_ids: FrozenSet[int]
+    client_ids: FrozenSet[int]
+    tenant_ids: FrozenSet[int]
+
+
+# UserScope is immutable, so every anonymous request can share one instance.
+_ANON_SCOPE = UserScope(user_id=None, epc_ids=frozenset(), client_ids=frozenset(), tenant_ids=frozenset())
+
+
+# ============================================================================
+# Responses
+# ============================================================================
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson instead of the stdlib encoder.
+
+    Equivalent to ``fastapi.responses.ORJSONResponse``, which newer FastAPI
+    releases deprecate (and warn about on every instantiation).
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+
+
+def _etag_response(
+    request: Request,
+    payload: Any,
+    *,
+    cache_control: str = "private, max-age=60",
+) -> Response:
+    """Return ``payload`` as JSON with an ETag, or a bodiless 304 if the client already has it."""
+    body = orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+    etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+    # Payloads depend on the caller's scope, so shared caches must key on the user.
+    headers = {"ETag": etag, "Cache-Control": cache_control, "Vary": "X-User-Id"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type="application/json", headers=headers)
 
 
 # ============================================================================
 # Common Helper Functions
 # ============================================================================
 
+def _coerce_id(item: Any) -> Optional[int]:
+    """Convert a single identifier to int, returning None when it is not numeric."""
+    if isinstance(item, int):
+        return int(item)
+    if isinstance(item, str):
+        candidate = item.strip()
+        if candidate.isdigit() or (candidate[:1] == "-" and candidate[1:].isdigit()):
+            return int(candidate)
+        return None
+    if item is None:
+        return None
+    if isinstance(item, float):
+        # NaN / inf would raise (ValueError / OverflowError) in int().
+        return int(item) if math.isfinite(item) else None
+    try:
+        return int(cast(Any, item))
+    except (TypeError, ValueError, OverflowError):
+        return None
+
+
 def _normalize_ids(value: Optional[Any]) -> List[int]:
     """Normalize various input types to a list of integers."""
     if value is None:
         return []
     if isinstance(value, (list, tuple, set)):
-        result: List[int] = []
-        for item in value:
-            if item is None:
-                continue
-            try:
-                result.append(int(cast(Any, item)))
-            except (TypeError, ValueError):
-                continue
-        return result
-    try:
-        return [int(cast(Any, value))]
-    except (TypeError, ValueError):
-        return []
+        # Fast path: DB helpers already return homogeneous lists of ints.
+        if all(type(item) is int for item in value):
+            return list(value)
+        return [item_id for item_id in map(_coerce_id, value) if item_id is not None]
+    item_id = _coerce_id(value)
+    return [] if item_id is None else [item_id]
 
 
 def _parse_user_id(raw_value: Optional[str], *, source: str) -> Optional[int]:
@@ -71,17 +153,33 @@ def _parse_user_id(raw_value: Optional[str], *, source: str) -> Optional[int]:
         raise HTTPException(status_code=400, detail=f"Invalid {source}: {raw_value}") from exc
 
 
+# Strings already in the exact shape produced by ``datetime.isoformat()``
+# (seconds precision, optional non-zero microseconds, optional UTC offset).
+_CANONICAL_ISO_RE = re.compile(
+    r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\.(?!0{6})\d{6})?(?:[+-]\d{2}:\d{2})?"
+)
+
+
 def _normalize_timestamp(value: Optional[object]) -> Optional[str]:
     """Normalize timestamp to ISO format string."""
     if value is None:
         return None
     if isinstance(value, datetime):
         return value.isoformat()
-    value_str = str(value).strip()
+    return _normalize_timestamp_str(value if isinstance(value, str) else str(value))
+
+
+@lru_cache(maxsize=65536)
+def _normalize_timestamp_str(raw_value: str) -> Optional[str]:
+    """String branch of `_normalize_timestamp`, memoized: rows in a page share many timestamps."""
+    value_str = raw_value.strip()
     if not value_str:
         return None
     candidate = value_str.replace(" ", "T")
     candidate = candidate.replace("Z", "+00:00") if candidate.endswith("Z") else candidate
+    # Fast path: DB values are usually already canonical, skip the parse round-trip.
+    if _CANONICAL_ISO_RE.fullmatch(candidate):
+        return candidate
     try:
         return datetime.fromisoformat(candidate).isoformat()
     except ValueError:
@@ -92,37 +190,103 @@ def _normalize_timestamp(value: Optional[object]) -> Optional[str]:
 # User Scope Helpers (Shared across APIs)
 # ============================================================================
 
+def _get_user_scope_bundle_cached(user_id: int) -> Dict[str, Any]:
+    """Return `DbQueries.get_user_scope_bundle` through the user info TTL cache."""
+    bundle = _USER_INFO_CACHE.get(user_id)
+    if bundle is None:
+        bundle = DbQueries.get_user_scope_bundle(user_id)
+        _USER_INFO_CACHE.set(user_id, bundle)
+        # The bundle already carries each tenant's client; share it with the
+        # tenant -> client cache used by /buildings and /tenants.
+        for tenant_id, client_id in bundle["tenant_client_id"].items():
+            _TENANT_CLIENT_CACHE.set(tenant_id, client_id)
+    return bundle
+
+
+def _get_client_ids_for_tenants_cached(tenant_ids: Iterable[int]) -> Dict[int, Optional[int]]:
+    """Return a tenant -> client mapping, fetching cache misses in a single query."""
+    mapping: Dict[int, Optional[int]] = _TENANT_CLIENT_CACHE.get_many(tenant_ids)
+    missing = [tenant_id for tenant_id in tenant_ids if tenant_id not in mapping]
+    if missing:
+        fetched = DbQueries.get_client_ids_for_tenants(missing)
+        for tenant_id in missing:
+            client_id = fetched.get(tenant_id)
+            _TENANT_CLIENT_CACHE.set(tenant_id, client_id)
+            mapping[tenant_id] = client_id
+    return mapping
+
+
+def _get_building_ids_for_tenants_cached(tenant_ids: FrozenSet[int], client_id: int) -> FrozenSet[int]:
+    """Cached ``DbQueries.get_building_ids_for_tenants`` keyed by client and tenant set."""
+    return _TENANT_BUILDINGS_CACHE.get_or_set(
+        (client_id, tenant_ids),
+        lambda: frozenset(DbQueries.get_building_ids_for_tenants(tenant_ids, client_id=client_id)),
+    )
+
+
+def _get_active_user_by_email_cached(email: str) -> Optional[Dict[str, Any]]:
+    """Cached ``MeterLoggingDbQueries.get_active_user_by_email`` (misses are not cached)."""
+    user = _USER_BY_EMAIL_CACHE.get(email)
+    if user is None:
+        with db_connection() as conn:
+            user = MeterLoggingDbQueries.get_active_user_by_email(email, conn=conn)
+        if user is not None:
+            _USER_BY_EMAIL_CACHE.set(email, user)
+    return user
+
+
+def invalidate_user_scope(user_id: int) -> None:
+    """Drop cached scope and login information for a user (call after user updates)."""
+    _USER_INFO_CACHE.pop(user_id)
+    # The email of an updated user may itself have changed; edits are rare,
+    # so drop every cached login lookup.
+    _USER_BY_EMAIL_CACHE.clear()
+
+
 def _get_user_scope(request: Request) -> UserScope:
     """Get user scope from request (returns UserScope dataclass).
     
     Standardized user scope function used across all APIs.
     Returns a UserScope dataclass with user_id, epc_ids, client_ids, and tenant_ids.
+    The result is memoized on ``request.state.user_scope`` for the rest of the request.
     """
-    header_user_id = request.headers.get("x-user-id") or request.headers.get("x-userid")
-    user_id = _parse_user_id(header_user_id, source="X-User-Id header")
+    cached_scope = getattr(request.state, "user_scope", None)
+    if cached_scope is not None:
+        return cached_scope
+    scope = _build_user_scope(request)
+    request.state.user_scope = scope
+    return scope
+
+
+def _build_user_scope(request: Request) -> UserScope:
+    """Resolve the user scope for a request (uncached)."""
+    # AuthMiddleware already parsed the X-User-Id header / user_id query param.
+    user_id = getattr(request.state, "parsed_user_id", None)
+    if user_id is None:
+        # Single pass over the raw headers for both accepted spellings.
+        header_user_id = _header_user_id(request.scope)
+        user_id = _parse_user_id(header_user_id, source="X-User-Id header")
     if user_id is None:
         query_user_id = request.query_params.get("user_id")
         user_id = _parse_user_id(query_user_id, source="user_id query parameter")
 
     if user_id is None:
-        return UserScope(user_id=None, epc_ids=[], client_ids=[], tenant_ids=[])
-
-    info = DbQueries.get_info_for_user(user_id)
-    epc_ids = sorted(set(_normalize_ids(info.get("epc_id"))))
-    client_ids = _normalize_ids(info.get("client_id"))
-    tenant_ids = sorted(set(_normalize_ids(info.get("tenant_id"))))
-
-    for tenant_id in tenant_ids:
-        client_id = DbQueries.get_client_id_for_tenant(tenant_id)
-        if client_id is not None:
-            client_ids.append(client_id)
-
-    client_ids = sorted({client_id for client_id in client_ids if client_id is not None})
+        return _ANON_SCOPE
+
+    # One query returns the assignments and the client of every assigned tenant.
+    info = _get_user_scope_bundle_cached(user_id)
+    # Scope ids are only used for membership checks and IN (...) filters, so
+    # plain sets (no sorting) are enough; _normalize_ids never yields None.
+    tenant_ids = frozenset(_normalize_ids(info.get("tenant_id")))
+    client_ids = set(_normalize_ids(info.get("client_id")))
+    client_ids.update(
+        client_id for client_id in info["tenant_client_id"].values() if client_id is not None
+    )
 
     return UserScope(
         user_id=user_id,
-        epc_ids=epc_ids,
-        client_ids=client_ids,
+        epc_ids=frozenset(_normalize_ids(info.get("epc_id"))),
+        client_ids=frozenset(client_ids),
         tenant_ids=tenant_ids,
     )
 
@@ -130,33 +294,55 @@ def _get_user_scope(request: Request) -> UserScope:
 # ============================================================================
 # Reporting API Helpers
 # ============================================================================
+# These helpers run blocking SQLite queries. Call them from plain ``def``
+# route handlers, which FastAPI runs in its threadpool, so they never stall
+# the event loop.
+
+# Shared 403 details, so the raise paths reuse one string object.
+_ERR_CLIENT_DENIED = "Current user does not have access to the requested client."
+_ERR_TENANT_DENIED = "Current user does not have access to the requested tenant."
+
 
 def _resolve_client(client_token: str) -> Dict[str, Any]:
-    """Resolve client by ID or name."""
-    lookup: Optional[Dict[str, Any]] = None
-    if client_token.isdigit():
-        lookup = DbQueries.get_client_by_id(int(client_token))
-    if lookup is None:
-        lookup = DbQueries.get_client_by_name(client_token)
+    """Resolve client by ID or name (cached; unknown tokens are not cached)."""
+    lookup = _CLIENT_BY_TOKEN_CACHE.get(client_token)
     if lookup is None:
-        raise HTTPException(status_code=404, detail=f"Client '{client_token}' not found.")
+        lookup = DbQueries.get_client_by_token(client_token)
+        if lookup is None:
+            raise HTTPException(status_code=404, detail=f"Client '{client_token}' not found.")
+        _CLIENT_BY_TOKEN_CACHE.set(client_token, lookup)
     return lookup
 
 
-def _ensure_client_access(scope: UserScope, client_id: int) -> None:
+def invalidate_client_lookups() -> None:
+    """Drop cached client/tenant resolutions (call after client or tenant writes)."""
+    _CLIENT_BY_TOKEN_CACHE.clear()
+    _TENANT_BY_TOKEN_CACHE.clear()
+    _TENANT_BUILDINGS_CACHE.clear()
+
+
+def _ensure_client_access_strict(scope: UserScope, client_id: int) -> None:
     """Ensure user has access to the requested client."""
-    if AUTH_BYPASS_SCOPE:
-        return
     if scope.user_id is None:
         return
     if scope.client_ids:
         if client_id not in scope.client_ids:
             raise HTTPException(
                 status_code=403,
-                detail="Current user does not have access to the requested client.",
+                detail=_ERR_CLIENT_DENIED,
             )
 
 
+def _ensure_client_access_bypass(scope: UserScope, client_id: int) -> None:
+    """Scope checks are disabled (AUTH_BYPASS_SCOPE): allow every client."""
+    return None
+
+
+# AUTH_BYPASS_SCOPE is fixed for the life of the process, so pick the
+# implementation once at import time instead of branching on every call.
+_ensure_client_access = _ensure_client_access_bypass if AUTH_BYPASS_SCOPE else _ensure_client_access_strict
+
+
 def _resolve_tenant_for_client(
     *,
     scope: UserScope,
@@ -164,28 +350,29 @@ def _resolve_tenant_for_client(
     tenant_token: str,
 ) -> Dict[str, Any]:
     """Resolve tenant for a specific client."""
+    # A numeric token outside a restricted scope is refused before any lookup.
+    if scope.tenant_ids and tenant_token.isdigit() and int(tenant_token) not in scope.tenant_ids:
+        raise HTTPException(
+            status_code=403,
+            detail=_ERR_TENANT_DENIED,
+        )
     client_id = client_row["id"]
-    tenant_row: Optional[Dict[str, Any]] = None
-    if tenant_token.isdigit():
-        tenant_row = DbQueries.get_tenant_by_id(int(tenant_token))
-        if tenant_row is None or tenant_row["client_id"] != client_id:
-            raise HTTPException(
-                status_code=404,
-                detail=f"Tenant '{tenant_token}' not found for client '{client_row['name']}'.",
-            )
-    else:
-        tenant_row = DbQueries.get_tenant_by_name(client_id=client_id, tenant_name=tenant_token)
+    cache_key = (client_id, tenant_token)
+    tenant_row = _TENANT_BY_TOKEN_CACHE.get(cache_key)
+    if tenant_row is None:
+        tenant_row = DbQueries.get_tenant_by_token(client_id=client_id, tenant_token=tenant_token)
         if tenant_row is None:
             raise HTTPException(
                 status_code=404,
                 detail=f"Tenant '{tenant_token}' not found for client '{client_row['name']}'.",
             )
+        _TENANT_BY_TOKEN_CACHE.set(cache_key, tenant_row)
 
     tenant_id = tenant_row["id"]
     if scope.tenant_ids and tenant_id not in scope.tenant_ids:
         raise HTTPException(
             status_code=403,
-            detail="Current user does not have access to the requested tenant.",
+            detail=_ERR_TENANT_DENIED,
         )
     return tenant_row
 
@@ -206,6 +393,11 @@ def _execute_report_job(
     load_ids: Optional[List[int]] = None,
 ) -> None:
     """Background task that generates a report and emails it if requested."""
+    # Imported lazily: the reporting stack (plotly, data preparation, email)
+    # is only needed inside report worker processes, not at API startup.
+    from backend.services.domain.reporting import generate_report_for_tenant_artifacts
+    from backend.services.services.email import send_report_email
+
     logger = ReportLogger()
     try:
         report_path, metadata, _html = generate_report_for_tenant_artifacts(
@@ -236,8 +428,122 @@ def _execute_report_job(
                 logger.info(f"📬 Email sent to {user_email}")
             else:
                 logger.warning(f"⚠️ Failed to send report email to {user_email}")
-    except Exception as exc:  # pragma: no cover - defensive logging
+    except Exception as exc:
         logger.error(f"❌ Error generating report for tenant {tenant_id}: {exc}")
+        # Re-raise so `_run_background_job` marks the job as failed.
+        raise
+
+
+def _get_report_executor() -> ProcessPoolExecutor:
+    """Return the shared report process pool, creating it on first use."""
+    global _REPORT_EXECUTOR
+    if _REPORT_EXECUTOR is None:
+        _REPORT_EXECUTOR = ProcessPoolExecutor(
+            max_workers=REPORT_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _REPORT_EXECUTOR
+
+
+def shutdown_report_executor() -> None:
+    """Stop the report process pool (call on application shutdown).
+
+    Queued jobs are cancelled (and marked failed); running jobs are allowed to
+    finish, so this blocks: call it from a thread, not the event loop.
+    """
+    global _REPORT_EXECUTOR
+    if _REPORT_EXECUTOR is not None:
+        _REPORT_EXECUTOR.shutdown(wait=True, cancel_futures=True)
+        _REPORT_EXECUTOR = None
+
+
+# Job status lives in the report_jobs table (not in this process), so
+# GET /reports/jobs/{job_id} can be answered by any uvicorn worker.
+def _run_background_job(job_id: str, job: Callable[..., None], job_kwargs: Dict[str, Any]) -> None:
+    """Run a queued job in the report pool, recording its status in report_jobs."""
+    ReportingDbQueries.update_report_job_status(job_id, "running")
+    try:
+        job(**job_kwargs)
+    except Exception as exc:
+        ReportingDbQueries.update_report_job_status(job_id, "failed", error=str(exc))
+        raise
+    ReportingDbQueries.update_report_job_status(job_id, "finished")
+
+
+def _report_job_done_callback(job_id: str) -> Callable[[Future], None]:
+    """Build the done callback for a job: log pool failures and mark the job failed.
+
+    Failures inside the job are recorded by `_run_background_job` itself; this
+    covers jobs that never ran (unpicklable arguments, crashed worker).
+    """
+    def _on_done(future: Future) -> None:
+        exc = None if future.cancelled() else future.exception()
+        if future.cancelled() or exc is not None:
+            ReportLogger().error(f"❌ Report job {job_id} failed in worker pool: {exc}")
+            try:
+                job = ReportingDbQueries.get_report_job(job_id)
+                if job is not None and job["status"] != "failed":
+                    ReportingDbQueries.update_report_job_status(
+                        job_id, "failed", error=str(exc) if exc else "cancelled"
+                    )
+            except Exception as db_exc:  # pragma: no cover - defensive logging
+                ReportLogger().error(f"❌ Could not record failure of report job {job_id}: {db_exc}")
+    return _on_done
+
+
+def submit_background_job(
+    job: Callable[..., None],
+    *,
+    owner_user_id: Optional[int] = None,
+    owner_client_id: Optional[int] = None,
+    **job_kwargs: Any,
+) -> str:
+    """Queue a long-running job on the report process pool and return its job id.
+
+    ``job`` must be a module-level function and all arguments must be
+    picklable (ints, strings, datetimes, lists, paths). The submitting user
+    and client are stored with the job so only they can poll its status.
+    """
+    job_id = uuid.uuid4().hex
+    ReportingDbQueries.create_report_job(job_id, user_id=owner_user_id, client_id=owner_client_id)
+    try:
+        future = _get_report_executor().submit(_run_background_job, job_id, job, job_kwargs)
+    except Exception as exc:
+        ReportingDbQueries.update_report_job_status(job_id, "failed", error=str(exc))
+        raise
+    future.add_done_callback(_report_job_done_callback(job_id))
+    return job_id
+
+
+def submit_report_job(
+    *,
+    owner_user_id: Optional[int] = None,
+    owner_client_id: Optional[int] = None,
+    **job_kwargs: Any,
+) -> str:
+    """Queue `_execute_report_job` on the report process pool and return its job id."""
+    return submit_background_job(
+        _execute_report_job,
+        owner_user_id=owner_user_id,
+        owner_client_id=owner_client_id,
+        **job_kwargs,
+    )
+
+
+def get_background_job(job_id: str, scope: UserScope, unscoped: bool = False) -> Dict[str, Any]:
+    """Return a job's row ("status", "error", ...) or raise 404.
+
+    Jobs of other users are reported as not found unless the caller is
+    unscoped (admin roles) or has access to the job's client.
+    """
+    job = ReportingDbQueries.get_report_job(job_id)
+    if job is None or not (
+        unscoped
+        or (job["user_id"] is not None and job["user_id"] == scope.user_id)
+        or (job["client_id"] is not None and job["client_id"] in scope.client_ids)
+    ):
+        raise HTTPException(status_code=404, detail=f"Job '{job_id}' not found or expired")
+    return job
 
 
 # ============================================================================
@@ -246,8 +552,34 @@ def _execute_report_job(
 
 def _resolve_meter_pk_or_404(meter_identifier: str) -> int:
     """Resolve meter primary key from identifier or raise 404."""
+    meter_pk = _METER_PK_CACHE.get(meter_identifier)
+    if meter_pk is not None:
+        return meter_pk
     try:
-        return MeterLoggingDbQueries.get_meter_pk_for_identifier(meter_identifier)
+        meter_pk = MeterLoggingDbQueries.get_meter_pk_for_identifier(meter_identifier)
     except ValueError as exc:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc))
+    _METER_PK_CACHE.set(meter_identifier, meter_pk)
+    return meter_pk
+
+
+def _resolve_meter_pks_or_404(meter_identifiers: Iterable[str]) -> Dict[str, int]:
+    """Resolve several meter identifiers at once (cache first, then one query) or raise 404."""
+    identifiers = list(dict.fromkeys(meter_identifiers))
+    mapping: Dict[str, int] = _METER_PK_CACHE.get_many(identifiers)
+    missing = [identifier for identifier in identifiers if identifier not in mapping]
+    if missing:
+        fetched = MeterLoggingDbQueries.get_meter_pks_for_identifiers(missing)
+        for identifier in missing:
+            meter_pk = fetched.get(identifier)
+            if meter_pk is None:
+                detail = (
+                    "meter identifier must be provided"
+                    if not identifier
+                    else f"Meter '{identifier}' not found"
+                )
+                raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=detail)
+            _METER_PK_CACHE.set(identifier, meter_pk)
+            mapping[identifier] = meter_pk
+    return mapping
 
@@ -4,22 +4,42 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from typing import Dict, List, Optional
+from itertools import islice
+from typing import Any, Dict, Hashable, Iterator, List, Optional, Tuple
 
-from fastapi import APIRouter, HTTPException, Query, Request, status
-from pydantic import BaseModel, ConfigDict
+import numpy as np
+import orjson
+from fastapi import APIRouter, HTTPException, Query, Request, Response, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, ConfigDict, ValidationError
 
 from backend.api.api_helpers import (
-    _normalize_ids,
+    ORJSONResponse,
+    _get_active_user_by_email_cached,
     _normalize_timestamp,
-    _parse_user_id,
     _resolve_meter_pk_or_404,
+    _resolve_meter_pks_or_404,
 )
+from backend.services.core.cache import TTLCache
 from backend.services.data.db_manager import MeterLoggingDbQueries
-from backend.services.auth.permissions import require_roles, UserRole
+from backend.services.auth.permissions import ROLE_HIERARCHY, is_unscoped_request, require_roles, UserRole
 
 
-meter_router = APIRouter(prefix="/meters/v1", tags=["Meter Logging"])
+# The list endpoints return ORJSONResponse instances directly: rows come
+# straight from our own schema, so FastAPI's per-row response_model validation
+# is skipped. The response models still document the OpenAPI schema.
+meter_router = APIRouter(
+    prefix="/meters/v1",
+    tags=["Meter Logging"],
+    default_response_class=ORJSONResponse,
+)
+
+
+# Read-side row models are never mutated once built: freeze them and drop
+# unknown row keys instead of carrying them along as extras.
+_ROW_MODEL_CONFIG = ConfigDict(frozen=True, extra="ignore")
 
 
 class BuildingSummary(BaseModel):
@@ -37,6 +57,8 @@ class TenantSummary(BaseModel):
     active_units: int
     last_record_at: Optional[str] = None
 
+    model_config = _ROW_MODEL_CONFIG
+
 
 class TenantSummaryResponse(BaseModel):
     tenants: list[TenantSummary]
@@ -60,6 +82,8 @@ class MeterAssignment(BaseModel):
     loads: list[int]
     last_record: Optional[MeterAssignmentLastRecord] = None
 
+    model_config = _ROW_MODEL_CONFIG
+
 
 class MeterAssignmentsResponse(BaseModel):
     tenant_id: int
@@ -135,6 +159,8 @@ class MeterRecordHistoryItem(BaseModel):
     approver_signature: Optional[str] = None
     created_at: str
 
+    model_config = _ROW_MODEL_CONFIG
+
 
 class MeterRecordHistoryResponse(BaseModel):
     records: list[MeterRecordHistoryItem]
@@ -151,6 +177,8 @@ class BuildingResponse(BaseModel):
     name: str
     client_id: int
 
+    model_config = _ROW_MODEL_CONFIG
+
 
 class BuildingsResponse(BaseModel):
     buildings: list[BuildingResponse]
@@ -161,38 +189,133 @@ class FloorSummary(BaseModel):
     unit_count: int
     meter_count: int
 
+    model_config = _ROW_MODEL_CONFIG
+
 
 class FloorsResponse(BaseModel):
     tenant_id: int
     floors: list[FloorSummary]
 
 
+# Finish every schema at import time (a no-op for models that are already
+# complete) so no validator is built lazily on the first request.
+for _model in (
+    BuildingSummary, TenantSummary, TenantSummaryResponse, UnitSummary,
+    MeterAssignmentLastRecord, MeterAssignment, MeterAssignmentsResponse,
+    MeterRecordInput, MeterRecordBatchRequest, MeterRecordAccepted,
+    MeterRecordWarning, MeterRecordBatchResponse, ApprovalInfo, ApprovalRequest,
+    MeterRecordHistoryItem, MeterRecordHistoryResponse, MeterMetaResponse,
+    BuildingResponse, BuildingsResponse, FloorSummary, FloorsResponse,
+):
+    _model.model_rebuild()
+del _model
+
+
+def _tenant_summary(
+    summary: Dict[str, Any],
+    *,
+    building: Dict[str, Any],
+    tenant_floors: int,
+) -> Dict[str, Any]:
+    """Shape a tenant summary row exactly like ``TenantSummary``."""
+    return {
+        "tenant_id": summary["tenant_id"],
+        "tenant_name": summary["tenant_name"],
+        "client_id": summary["client_id"],
+        "building": {"id": building["id"], "name": building["name"], "floor": building.get("floor")},
+        "tenant_floors": tenant_floors,
+        "active_units": summary["active_units"],
+        "last_record_at": _normalize_timestamp(summary.get("last_record_at")),
+    }
+
+
+# Building/tenant/floor/meter listings change on the scale of minutes, so their
+# encoded bodies are kept briefly (per worker). Record writes bump the version
+# that prefixes every key, which only invalidates the cache of the worker that
+# handled the write; other uvicorn workers may serve a stale listing for up to
+# the 30s TTL.
+_LISTING_CACHE = TTLCache(maxsize=1024, ttl=30)
+_listing_version = 0
+
+
+def _listing_key(*parts: Hashable) -> Tuple[Hashable, ...]:
+    """Build a listing cache key tied to the current data version."""
+    return (_listing_version, *parts)
+
+
+def _cached_listing(key: Tuple[Hashable, ...]) -> Optional[Response]:
+    """Return the cached listing response for ``key``, if any."""
+    body = _LISTING_CACHE.get(key)
+    if body is None:
+        return None
+    return Response(body, media_type="application/json")
+
+
+def _store_listing(key: Optional[Tuple[Hashable, ...]], payload: Dict[str, Any]) -> ORJSONResponse:
+    """Render ``payload`` and, when ``key`` is given, cache the encoded body."""
+    response = ORJSONResponse(payload)
+    if key is not None:
+        _LISTING_CACHE.set(key, response.body)
+    return response
+
+
+def _invalidate_listings() -> None:
+    """Drop cached listings after meter records or approvals change."""
+    global _listing_version
+    _listing_version += 1
+    _LISTING_CACHE.clear()
+
+
+def _meter_record_item(row: Dict[str, Any]) -> Dict[str, Any]:
+    """Shape a meter record row exactly like ``MeterRecordHistoryItem``."""
+    return {
+        "meter_record_id": row["meter_record_id"],
+        "meter_id": row.get("meter_identifier") or str(row["meter_pk"]),
+        "meter_pk": row["meter_pk"],
+        "tenant_id": row["tenant_id"],
+        "session_id": row["session_id"],
+        "client_record_id": row["client_record_id"],
+        "timestamp_record": _normalize_timestamp(row["timestamp_record"]),
+        "meter_kWh": float(row["meter_kWh"]),
+        "encoder_user_id": row["encoder_user_id"],
+        "approver_name": row["approver_name"],
+        "approver_signature": row["approver_signature"],
+        "created_at": _normalize_timestamp(row["created_at"]),
+    }
+
+
+# Records encoded per streamed chunk (one threadpool hop each).
+_RECORD_STREAM_CHUNK = 128
+
+
+def _encode_record_chunk(records: Iterator[Dict[str, Any]]) -> bytes:
+    """Encode up to ``_RECORD_STREAM_CHUNK`` records as comma-joined JSON objects."""
+    return b",".join(
+        orjson.dumps(_meter_record_item(row)) for row in islice(records, _RECORD_STREAM_CHUNK)
+    )
 
 
 @meter_router.get("/buildings", response_model=BuildingsResponse)
 # Note: Permission is enforced by AuthMiddleware via ROUTE_PERMISSIONS mapping
 # Decorator is optional - only needed if this endpoint needs different permissions
-async def list_buildings(
+def list_buildings(
     request: Request,
     user_id: int = Query(..., description="User identifier"),
 ):
     """Get buildings assigned to the specified user."""
+    # Check if user is super_admin via request state (set by middleware)
+    is_super_admin = is_unscoped_request(request)
+    cache_key = _listing_key("buildings", None if is_super_admin else user_id)
+    cached = _cached_listing(cache_key)
+    if cached is not None:
+        return cached
     try:
-        # Check if user is super_admin via request state (set by middleware)
-        if request and hasattr(request.state, "user_role") and request.state.user_role == UserRole.SUPER_ADMIN:
+        if is_super_admin:
             buildings = MeterLoggingDbQueries.list_all_buildings()
         else:
             buildings = MeterLoggingDbQueries.list_buildings_for_user(user_id=user_id)
-        return BuildingsResponse(
-            buildings=[
-                BuildingResponse(
-                    id=b["id"],
-                    name=b["name"],
-                    client_id=b["client_id"],
-                )
-                for b in buildings
-            ]
-        )
+        # The query layer already returns dicts shaped like BuildingResponse.
+        return _store_listing(cache_key, {"buildings": buildings})
     except ValueError as exc:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -206,33 +329,28 @@ async def list_buildings(
 
 
 @meter_router.get("/buildings/{building_id}/tenants", response_model=TenantSummaryResponse)
-async def list_tenants_for_building(
+def list_tenants_for_building(
     building_id: int,
 ):
     """Get tenants for a specific building."""
+    cache_key = _listing_key("building_tenants", building_id)
+    cached = _cached_listing(cache_key)
+    if cached is not None:
+        return cached
     try:
         summaries = MeterLoggingDbQueries.list_tenants_for_building(
             building_id=building_id,
         )
         
-        tenants: list[TenantSummary] = []
-        for summary in summaries:
-            building_data = summary["building"]
-            tenants.append(
-                TenantSummary(
-                    tenant_id=summary["tenant_id"],
-                    tenant_name=summary["tenant_name"],
-                    client_id=summary["client_id"],
-                    building=BuildingSummary(
-                        id=building_data["id"],
-                        name=building_data["name"]
-                    ),
-                    tenant_floors=summary["number_of_floors"],
-                    active_units=summary["active_units"],
-                    last_record_at=_normalize_timestamp(summary.get("last_record_at")),
-                )
+        tenants = [
+            _tenant_summary(
+                summary,
+                building={"id": summary["building"]["id"], "name": summary["building"]["name"]},
+                tenant_floors=summary["number_of_floors"],
             )
-        return TenantSummaryResponse(tenants=tenants)
+            for summary in summaries
+        ]
+        return _store_listing(cache_key, {"tenants": tenants})
     except HTTPException:
         raise
     except ValueError as exc:
@@ -245,21 +363,16 @@ async def list_tenants_for_building(
 
 
 @meter_router.get("/tenants/{tenant_id}/floors", response_model=FloorsResponse)
-async def get_tenant_floors(tenant_id: int):
+def get_tenant_floors(tenant_id: int):
     """Get distinct floors for a tenant."""
+    cache_key = _listing_key("floors", tenant_id)
+    cached = _cached_listing(cache_key)
+    if cached is not None:
+        return cached
     try:
         floors = MeterLoggingDbQueries.get_floors_for_tenant(tenant_id)
-        return FloorsResponse(
-            tenant_id=tenant_id,
-            floors=[
-                FloorSummary(
-                    floor=f["floor"],
-                    unit_count=f["unit_count"],
-                    meter_count=f["meter_count"],
-                )
-                for f in floors
-            ],
-        )
+        # Rows already match FloorSummary; skip per-row model construction.
+        return _store_listing(cache_key, {"tenant_id": tenant_id, "floors": floors})
     except ValueError as exc:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
     except Exception as exc:
@@ -270,44 +383,48 @@ async def get_tenant_floors(tenant_id: int):
 
 
 @meter_router.get("/tenants", response_model=TenantSummaryResponse)
-async def list_meter_logging_tenants(
+def list_meter_logging_tenants(
     client_id: int = Query(..., description="Client identifier"),
     building_id: Optional[int] = Query(None, description="Filter by building identifier"),
 ):
+    cache_key = _listing_key("client_tenants", client_id, building_id)
+    cached = _cached_listing(cache_key)
+    if cached is not None:
+        return cached
     try:
-        summaries = MeterLoggingDbQueries.list_tenants_for_client(
+        summaries = MeterLoggingDbQueries.list_tenant_summaries_for_client(
             client_id=client_id,
             building_id=building_id,
         )
     except ValueError as exc:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
 
-    tenants: list[TenantSummary] = []
-    for summary in summaries:
-        building_data = summary["building"]
-        tenants.append(
-            TenantSummary(
-                tenant_id=summary["tenant_id"],
-                tenant_name=summary["tenant_name"],
-                client_id=summary["client_id"],
-                building=BuildingSummary(**building_data),
-                tenant_floors=summary.get("number_of_floors", 0),
-                active_units=summary["active_units"],
-                last_record_at=_normalize_timestamp(summary.get("last_record_at")),
-            )
+    tenants = [
+        _tenant_summary(
+            summary,
+            building=summary["building"],
+            tenant_floors=summary.get("number_of_floors", 0),
         )
-    return TenantSummaryResponse(tenants=tenants)
+        for summary in summaries
+    ]
+    return _store_listing(cache_key, {"tenants": tenants})
 
 
 @meter_router.get(
     "/tenants/{tenant_id}/meters",
     response_model=MeterAssignmentsResponse,
 )
-async def get_tenant_meter_assignments(
+def get_tenant_meter_assignments(
     tenant_id: int,
     floor: Optional[int] = Query(None, description="Filter by floor number"),
 ):
     """Get meter assignments for a tenant, optionally filtered by floor."""
+    # Only the unfiltered listing is cached; per-floor views are rarer.
+    cache_key = _listing_key("meters", tenant_id) if floor is None else None
+    if cache_key is not None:
+        cached = _cached_listing(cache_key)
+        if cached is not None:
+            return cached
     try:
         assignments = MeterLoggingDbQueries.get_meter_assignments_for_tenant(
             tenant_id=tenant_id,
@@ -321,30 +438,30 @@ async def get_tenant_meter_assignments(
             detail=f"Failed to get meter assignments: {exc}",
         )
 
-    meters: list[MeterAssignment] = []
+    meters: list[Dict[str, Any]] = []
     try:
         for assignment in assignments:
             last_record = assignment.get("last_record")
             meters.append(
-                MeterAssignment(
-                    meter_id=assignment["meter_id"],
-                    meter_pk=assignment["meter_pk"],
-                    unit=UnitSummary(**assignment["unit"]),
-                    loads=assignment["loads"],
-                    last_record=(
-                        MeterAssignmentLastRecord(
-                            timestamp_record=_normalize_timestamp(
+                {
+                    "meter_id": assignment["meter_id"],
+                    "meter_pk": assignment["meter_pk"],
+                    "unit": assignment["unit"],
+                    "loads": assignment["loads"],
+                    "last_record": (
+                        {
+                            "timestamp_record": _normalize_timestamp(
                                 last_record.get("timestamp_record")
                             ),
-                            meter_kWh=float(last_record.get("meter_kWh")),
-                        )
+                            "meter_kWh": float(last_record.get("meter_kWh")),
+                        }
                         if last_record
                         else None
                     ),
-                )
+                }
             )
 
-        return MeterAssignmentsResponse(tenant_id=tenant_id, meters=meters)
+        return _store_listing(cache_key, {"tenant_id": tenant_id, "meters": meters})
     except Exception as exc:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -356,46 +473,62 @@ async def get_tenant_meter_assignments(
     "/records",
     response_model=MeterRecordBatchResponse,
     status_code=status.HTTP_200_OK,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": MeterRecordBatchRequest.model_json_schema()}},
+        }
+    },
 )
-async def submit_meter_records(payload: MeterRecordBatchRequest):
+async def submit_meter_records(request: Request):
+    # Validate the raw JSON body in one pass (pydantic-core parses and validates
+    # together) instead of json.loads() followed by per-record model validation.
+    try:
+        payload = MeterRecordBatchRequest.model_validate_json(await request.body())
+    except ValidationError as exc:
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in exc.errors(include_url=False)]
+        )
+
     if not payload.records:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="records list must not be empty",
         )
 
-    record_payloads: list[Dict[str, object]] = []
-    meter_cache: dict[str, int] = {}
-    for record in payload.records:
-        ts = record.timestamp_record
-        if ts.tzinfo is None:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="timestamp_record must include timezone information",
-            )
-        if record.meter_kWh < 0:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="meter_kWh must be non-negative",
-            )
-        meter_identifier = record.meter_id
-        if meter_identifier in meter_cache:
-            meter_pk = meter_cache[meter_identifier]
-        else:
-            meter_pk = _resolve_meter_pk_or_404(meter_identifier)
-            meter_cache[meter_identifier] = meter_pk
-        record_payloads.append(
-            {
-                "client_record_id": record.client_record_id,
-                "meter_id": meter_pk,
-                "meter_identifier": meter_identifier,
-                "timestamp_record": record.timestamp_record.isoformat(),
-                "meter_kWh": record.meter_kWh,
-            }
+    records = payload.records
+    if any(record.timestamp_record.tzinfo is None for record in records):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="timestamp_record must include timezone information",
+        )
+    kwh = np.fromiter((record.meter_kWh for record in records), dtype=np.float64, count=len(records))
+    if (kwh < 0).any():
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="meter_kWh must be non-negative",
         )
 
+    # Resolve every distinct meter in the batch with one lookup.
+    meter_pks = await run_in_threadpool(
+        _resolve_meter_pks_or_404, [record.meter_id for record in records]
+    )
+    record_payloads: list[Dict[str, object]] = [
+        {
+            "client_record_id": record.client_record_id,
+            "meter_id": meter_pks[record.meter_id],
+            "meter_identifier": record.meter_id,
+            "timestamp_record": record.timestamp_record.isoformat(),
+            "meter_kWh": record.meter_kWh,
+        }
+        for record in records
+    ]
+
     try:
-        accepted, warnings = MeterLoggingDbQueries.insert_meter_records(
+        # The handler stays async to read the raw body; the insert transaction
+        # runs in the threadpool so it does not block the event loop.
+        accepted, warnings = await run_in_threadpool(
+            MeterLoggingDbQueries.insert_meter_records,
             tenant_id=payload.tenant_id,
             session_id=payload.session_id,
             records=record_payloads,
@@ -403,6 +536,7 @@ async def submit_meter_records(payload: MeterRecordBatchRequest):
         )
     except ValueError as exc:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+    _invalidate_listings()
 
     return MeterRecordBatchResponse(
         tenant_id=payload.tenant_id,
@@ -413,7 +547,7 @@ async def submit_meter_records(payload: MeterRecordBatchRequest):
 
 
 @meter_router.post("/approvals", status_code=status.HTTP_200_OK)
-async def attach_meter_approval(request: ApprovalRequest):
+def attach_meter_approval(request: ApprovalRequest):
     updated = MeterLoggingDbQueries.attach_approval_to_session(
         tenant_id=request.tenant_id,
         session_id=request.session_id,
@@ -425,6 +559,7 @@ async def attach_meter_approval(request: ApprovalRequest):
             status_code=status.HTTP_404_NOT_FOUND,
             detail="No meter records found for tenant/session combination",
         )
+    _invalidate_listings()
     return {"updated": updated}
 
 
@@ -432,7 +567,7 @@ async def attach_meter_approval(request: ApprovalRequest):
     "/meter-records",
     response_model=MeterRecordHistoryResponse,
 )
-async def get_meter_records(
+def get_meter_records(
     tenant_id: Optional[int] = Query(None),
     meter_id: Optional[str] = Query(None),
     from_timestamp: Optional[str] = Query(None, alias="from"),
@@ -449,7 +584,7 @@ async def get_meter_records(
     if meter_id is not None:
         meter_pk = _resolve_meter_pk_or_404(meter_id)
 
-    records = MeterLoggingDbQueries.get_meter_records(
+    records = MeterLoggingDbQueries.iter_meter_records(
         tenant_id=tenant_id,
         meter_id=meter_pk,
         from_timestamp=from_timestamp,
@@ -457,113 +592,78 @@ async def get_meter_records(
         limit=limit,
     )
 
-    items: list[MeterRecordHistoryItem] = []
-    for row in records:
-        meter_identifier = row.get("meter_identifier") or str(row["meter_pk"])
-        items.append(
-            MeterRecordHistoryItem(
-                meter_record_id=row["meter_record_id"],
-                meter_id=meter_identifier,
-                meter_pk=row["meter_pk"],
-                tenant_id=row["tenant_id"],
-                session_id=row["session_id"],
-                client_record_id=row["client_record_id"],
-                timestamp_record=_normalize_timestamp(row["timestamp_record"]),
-                meter_kWh=float(row["meter_kWh"]),
-                encoder_user_id=row["encoder_user_id"],
-                approver_name=row["approver_name"],
-                approver_signature=row["approver_signature"],
-                created_at=_normalize_timestamp(row["created_at"]),
-            )
-        )
+    # Run the query and fetch the first rows before the response starts, so a
+    # SQL or connection error still surfaces as a 500 instead of a 200 with a
+    # truncated body. Pooled connections may move between threads.
+    first_chunk = _encode_record_chunk(records)
+
+    # A sync generator: Starlette pulls the remaining batches through its
+    # threadpool, keeping the blocking fetchmany calls off the event loop.
+    def encode_records():
+        yield b'{"records":[' + first_chunk
+        if first_chunk:
+            while chunk := _encode_record_chunk(records):
+                yield b"," + chunk
+        yield b"]}"
+
+    return StreamingResponse(encode_records(), media_type="application/json")
 
-    return MeterRecordHistoryResponse(records=items)
+
+# user_group string -> numeric role (hierarchy value) reported by /user-info.
+_ROLE_NUMBERS = {role.value: ROLE_HIERARCHY.get(role, 0) for role in UserRole}
 
 
 @meter_router.get("/user-id", response_model=dict)
-async def get_user_id_by_email(email: str = Query(..., description="User email address")):
+def get_user_id_by_email(email: str = Query(..., description="User email address")):
     """Get user ID from email address."""
-    from backend.services.data.db_manager.db_schema import get_db_connection
-    import sqlite3
-    
-    conn = get_db_connection()
-    try:
-        cursor = conn.cursor()
-        cursor.execute("SELECT id FROM users WHERE email = ? AND active = 1 LIMIT 1", (email,))
-        row = cursor.fetchone()
-        if row is None:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"User with email '{email}' not found",
-            )
-        return {"user_id": row["id"], "email": email}
-    finally:
-        conn.close()
+    user = _get_active_user_by_email_cached(email)
+    if user is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"User with email '{email}' not found",
+        )
+    return {"user_id": user["id"], "email": email}
 
 
 @meter_router.get("/user-info", response_model=dict)
-async def get_user_info_by_email(email: str = Query(..., description="User email address")):
+def get_user_info_by_email(email: str = Query(..., description="User email address")):
     """Get user information (ID, role, entity_id) from email address."""
-    from backend.services.data.db_manager.db_schema import get_db_connection
-    from backend.services.data.db_manager import MeterLoggingDbQueries
-    import sqlite3
-    
-    conn = get_db_connection()
     try:
-        cursor = conn.cursor()
-        cursor.execute(
-            "SELECT id, user_group, entity_id, company FROM users WHERE email = ? AND active = 1 LIMIT 1",
-            (email,)
-        )
-        row = cursor.fetchone()
-        if row is None:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"User with email '{email}' not found",
-            )
-        
-        user_id = row["id"]
-        user_group_str = row["user_group"]
-        
-        # Get user role using the query method (in case there's additional logic)
-        try:
-            user_group_str = MeterLoggingDbQueries.get_user_role_for_user(user_id=user_id, conn=conn)
-        except Exception:
-            # Fallback to direct DB value if query method fails
-            pass
-        
-        # Convert user_group string to numeric role (hierarchy value)
-        from backend.services.auth.permissions import UserRole, ROLE_HIERARCHY
-        try:
-            user_role_enum = UserRole(user_group_str)
-            role_number = ROLE_HIERARCHY.get(user_role_enum, 0)
-        except (ValueError, KeyError):
-            # If role is not in enum, default to 0
-            role_number = 0
-        
-        return {
-            "user_id": user_id,
-            "role": role_number,
-            "entity_id": row["entity_id"],
-            "email": email,
-            "company": row["company"],
-        }
-    except HTTPException:
-        raise
+        user = _get_active_user_by_email_cached(email)
     except Exception as exc:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to get user info: {exc}",
         )
-    finally:
-        conn.close()
+    if user is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"User with email '{email}' not found",
+        )
+
+    return {
+        "user_id": user["id"],
+        # Unknown user_group values map to 0
+        "role": _ROLE_NUMBERS.get(user["user_group"], 0),
+        "entity_id": user["entity_id"],
+        "email": email,
+        "company": user["company"],
+    }
+
+
+# Only server_time changes between calls, so the body is spliced from bytes.
+_META_PREFIX = b'{"version":"v1","non_decreasing_enforced":true,"server_time":"'
+_META_SUFFIX = b'"}'
+# Effectively static; let clients reuse it briefly instead of re-polling.
+_META_HEADERS = {"Cache-Control": "public, max-age=30"}
 
 
 @meter_router.get("/meta", response_model=MeterMetaResponse)
 async def get_meter_meta():
-    return MeterMetaResponse(
-        version="v1",
-        server_time=datetime.now(timezone.utc).isoformat(),
-        non_decreasing_enforced=True,
+    server_time = datetime.now(timezone.utc).isoformat().encode()
+    return Response(
+        content=_META_PREFIX + server_time + _META_SUFFIX,
+        media_type="application/json",
+        headers=_META_HEADERS,
     )
 
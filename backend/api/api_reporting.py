@@ -3,39 +3,54 @@
 
 from __future__ import annotations
 
+from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Annotated, Any, Dict, FrozenSet, List, Optional
 
-from fastapi import APIRouter, BackgroundTasks, HTTPException, Request
-from pydantic import BaseModel
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from pydantic import BaseModel, ConfigDict, Field
 
 from backend.api.api_helpers import (
     AUTH_BYPASS_SCOPE,
+    ORJSONResponse,
     UserScope,
     _ensure_client_access,
-    _execute_report_job,
+    _etag_response,
+    _get_building_ids_for_tenants_cached,
     _get_user_scope,
     _resolve_client,
     _resolve_tenant_for_client,
+    invalidate_client_lookups,
+    get_background_job,
+    submit_background_job,
+    submit_report_job,
 )
-from backend.services.core.config import DEFAULT_CLIENT
+from backend.services.auth.permissions import is_unscoped_request
+from backend.services.core.cache import TTLCache
+from backend.services.core.config import DEFAULT_CLIENT, PHILIPPINES_TZ
 from backend.services.core.utils import ReportLogger
 from backend.services.data.db_manager import DbQueries
-from backend.services.domain.reporting import (
-    generate_reports_for_client,
-    execute_last_records_job,
-    execute_billing_info_job,
-    execute_billing_comparison_job,
-)
-from backend.services.domain.reporting.settings_helpers import (
-    get_all_client_settings,
-    get_cutoff_datetime,
-    set_client_settings,
-    set_tenant_settings,
-)
 
 
-reporting_router = APIRouter(tags=["Reporting"])
+reporting_router = APIRouter(tags=["Reporting"], default_response_class=ORJSONResponse)
+
+# Resolved cutoffs keyed by (client_token, tenant_token, load_name); cleared by
+# the settings write endpoints below.
+_CUTOFF_CACHE = TTLCache(maxsize=4096, ttl=30)
+# Floor / unit listings keyed by (kind, tenant_id, floor). Access checks still
+# run on every request; only the layout query is skipped on a hit.
+_TENANT_LAYOUT_CACHE = TTLCache(maxsize=4096, ttl=60)
+
+
+# Date/time layouts are checked by pydantic-core while the body is parsed (422
+# on mismatch); an empty string still means "not set".
+DateStr = Annotated[str, Field(pattern=r"^(\d{4}-\d{2}-\d{2})?$")]
+TimeStr = Annotated[str, Field(pattern=r"^(\d{2}:\d{2})?$")]
+
+
+# Request bodies are read-only once parsed (pydantic v2 validates them in
+# pydantic-core); freezing makes accidental mutation in a handler an error.
+_REQUEST_MODEL_CONFIG = ConfigDict(frozen=True)
 
 
 class TenantReportRequest(BaseModel):
@@ -43,30 +58,57 @@ class TenantReportRequest(BaseModel):
     client_token: Optional[str] = DEFAULT_CLIENT
     loads_summary_path: Optional[str] = None
     month: Optional[str] = None  # Format: YYYY-MM
-    cutoff_date: Optional[str] = None  # Format: YYYY-MM-DD
-    cutoff_time: Optional[str] = None  # Format: HH:mm
-    start_date: Optional[str] = None  # Format: YYYY-MM-DD
-    start_time: Optional[str] = None  # Format: HH:mm
-    end_date: Optional[str] = None  # Format: YYYY-MM-DD
-    end_time: Optional[str] = None  # Format: HH:mm
+    cutoff_date: Optional[DateStr] = None  # Format: YYYY-MM-DD
+    cutoff_time: Optional[TimeStr] = None  # Format: HH:mm
+    start_date: Optional[DateStr] = None  # Format: YYYY-MM-DD
+    start_time: Optional[TimeStr] = None  # Format: HH:mm
+    end_date: Optional[DateStr] = None  # Format: YYYY-MM-DD
+    end_time: Optional[TimeStr] = None  # Format: HH:mm
     user_email: Optional[str] = None  # Email to send report to
     floor: Optional[int] = None
     unit_id: Optional[int] = None
     load_ids: Optional[List[int]] = None
 
+    model_config = _REQUEST_MODEL_CONFIG
+
 
 class ClientReportRequest(BaseModel):
     client_token: str = DEFAULT_CLIENT
     loads_summary_path: Optional[str] = None
 
+    model_config = _REQUEST_MODEL_CONFIG
+
+
+def _parse_ph_datetime(
+    date_str: Optional[str],
+    time_str: Optional[str],
+    field: str,
+) -> Optional[datetime]:
+    """Parse a ``YYYY-MM-DD`` date and ``HH:MM`` time pair as Philippines local time.
+
+    The layout is already enforced by ``DateStr`` / ``TimeStr``, so the fields
+    are sliced directly instead of running strptime's format parser. Returns
+    None unless both parts are given; raises HTTP 400 on out-of-range values.
+    """
+    if not (date_str and time_str):
+        return None
+    try:
+        naive = datetime(
+            int(date_str[0:4]), int(date_str[5:7]), int(date_str[8:10]),
+            int(time_str[0:2]), int(time_str[3:5]),
+        )
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid {field}_date or {field}_time format: {exc}",
+        ) from exc
+    return PHILIPPINES_TZ.localize(naive)
+
 
 @reporting_router.get("/clients", response_model=dict)
-async def get_clients(request: Request):
+def get_clients(request: Request):
     # Check if user is super_admin - if so, return all clients
-    from backend.services.auth.permissions import get_user_role_from_request, UserRole
-    user_role = get_user_role_from_request(request)
-    
-    if user_role == UserRole.SUPER_ADMIN:
+    if is_unscoped_request(request):
         # Super admin sees all clients
         client_filter = None
     else:
@@ -76,89 +118,80 @@ async def get_clients(request: Request):
     
     try:
         clients = DbQueries.list_clients(client_ids=client_filter)
-        return {
+        return _etag_response(request, {
             "clients": [client["name"] for client in clients],
             "count": len(clients),
-        }
+        })
     except Exception as exc:  # pragma: no cover
         raise HTTPException(status_code=500, detail=f"Failed to list clients: {exc}")
 
 
 @reporting_router.get("/buildings", response_model=dict)
-async def get_buildings(request: Request, client_token: str = DEFAULT_CLIENT):
-    scope = _get_user_scope(request)
+def get_buildings(
+    request: Request,
+    client_token: str = DEFAULT_CLIENT,
+    scope: UserScope = Depends(_get_user_scope),
+):
     client_row = _resolve_client(client_token)
     client_id = client_row["id"]
     _ensure_client_access(scope, client_id)
 
-    building_filter: Optional[List[int]] = None
+    building_filter: Optional[FrozenSet[int]] = None
     if scope.tenant_ids:
-        building_ids: set[int] = set()
-        for tenant_id in scope.tenant_ids:
-            tenant_client = DbQueries.get_client_id_for_tenant(tenant_id)
-            if tenant_client != client_id:
-                continue
-            building_id = DbQueries.get_building_id_for_tenant(tenant_id)
-            if building_id is not None:
-                building_ids.add(building_id)
-        if building_ids:
-            building_filter = sorted(building_ids)
+        # One (cached) join filtered by client server-side instead of a query per
+        # tenant. No sorting needed: the listing query orders by name.
+        building_filter = _get_building_ids_for_tenants_cached(scope.tenant_ids, client_id) or None
 
     try:
         buildings = DbQueries.list_buildings_for_client(
             client_id=client_id,
             building_ids=building_filter,
         )
-        return {
+        return _etag_response(request, {
             "client": client_row["name"],
             "buildings": [building["name"] for building in buildings],
             "count": len(buildings),
-        }
+        })
     except Exception as exc:  # pragma: no cover
         raise HTTPException(status_code=500, detail=f"Failed to list buildings: {exc}")
 
 
 @reporting_router.get("/tenants", response_model=dict)
-async def get_tenants(request: Request, client_token: str = DEFAULT_CLIENT):
-    scope = _get_user_scope(request)
+def get_tenants(
+    request: Request,
+    client_token: str = DEFAULT_CLIENT,
+    scope: UserScope = Depends(_get_user_scope),
+):
     client_row = _resolve_client(client_token)
     client_id = client_row["id"]
     _ensure_client_access(scope, client_id)
 
-    tenant_filter: Optional[List[int]] = None
-    if scope.tenant_ids:
-        tenant_filter = [
-            tenant_id
-            for tenant_id in scope.tenant_ids
-            if DbQueries.get_client_id_for_tenant(tenant_id) == client_id
-        ]
-        if not tenant_filter:
-            return {"client": client_row["name"], "tenants": [], "count": 0}
-
     try:
+        # list_tenants_for_client filters by client_id in SQL, so scope tenants
+        # of other clients drop out in the same query.
         tenants = DbQueries.list_tenants_for_client(
             client_id=client_id,
-            tenant_ids=tenant_filter,
+            tenant_ids=scope.tenant_ids or None,
         )
-        return {
+        return _etag_response(request, {
             "client": client_row["name"],
             "tenants": [tenant["name"] for tenant in tenants],
             "count": len(tenants),
-        }
+        })
     except Exception as exc:  # pragma: no cover
         raise HTTPException(status_code=500, detail=f"Failed to list tenants: {exc}")
 
 
 @reporting_router.get("/tenant/floors", response_model=dict)
-async def get_tenant_floors_for_reports(
+def get_tenant_floors_for_reports(
     request: Request,
     client_token: str = DEFAULT_CLIENT,
     tenant_token: str = "",
+    scope: UserScope = Depends(_get_user_scope),
 ):
     if not tenant_token:
         raise HTTPException(status_code=400, detail="tenant_token is required")
 
-    scope = _get_user_scope(request)
     client_row = _resolve_client(client_token)
     _ensure_client_access(scope, client_row["id"])
     tenant_row = _resolve_tenant_for_client(
@@ -168,30 +201,30 @@ async def get_tenant_floors_for_reports(
     )
     tenant_id = tenant_row["id"]
     try:
-        floors = DbQueries.get_floors_for_tenant(
-            tenant_id,
-            tenant_token=tenant_token,
+        floors = _TENANT_LAYOUT_CACHE.get_or_set(
+            ("floors", tenant_id, None),
+            lambda: DbQueries.get_floors_for_tenant(tenant_id, tenant_token=tenant_token),
         )
-        return {
+        return _etag_response(request, {
             "tenant_id": tenant_id,
             "tenant": tenant_row["name"],
             "floors": floors,
-        }
+        })
     except Exception as exc:  # pragma: no cover
         raise HTTPException(status_code=500, detail=f"Failed to list floors: {exc}")
 
 
 @reporting_router.get("/tenant/units", response_model=dict)
-async def get_tenant_units_for_reports(
+def get_tenant_units_for_reports(
     request: Request,
     client_token: str = DEFAULT_CLIENT,
     tenant_token: str = "",
     floor: Optional[int] = None,
+    scope: UserScope = Depends(_get_user_scope),
 ):
     if not tenant_token:
         raise HTTPException(status_code=400, detail="tenant_token is required")
 
-    scope = _get_user_scope(request)
     client_row = _resolve_client(client_token)
     _ensure_client_access(scope, client_row["id"])
     tenant_row = _resolve_tenant_for_client(
@@ -202,27 +235,24 @@ async def get_tenant_units_for_reports(
     tenant_id = tenant_row["id"]
 
     try:
-        units = DbQueries.get_units_for_tenant(
-            tenant_id,
-            floor=floor,
-            tenant_token=tenant_token,
+        units = _TENANT_LAYOUT_CACHE.get_or_set(
+            ("units", tenant_id, floor),
+            lambda: DbQueries.get_units_for_tenant(tenant_id, floor=floor, tenant_token=tenant_token),
         )
-        return {
+        return _etag_response(request, {
             "tenant_id": tenant_id,
             "tenant": tenant_row["name"],
             "units": units,
-        }
+        })
     except Exception as exc:  # pragma: no cover
         raise HTTPException(status_code=500, detail=f"Failed to list units: {exc}")
 
 
-@reporting_router.post("/reports/tenant", response_model=dict)
-async def generate_tenant_reports(
+@reporting_router.post("/reports/tenant", response_model=dict, status_code=status.HTTP_202_ACCEPTED)
+def generate_tenant_reports(
     request: TenantReportRequest,
-    background_tasks: BackgroundTasks,
-    fastapi_request: Request,
+    scope: UserScope = Depends(_get_user_scope),
 ):
-    scope = _get_user_scope(fastapi_request)
     client_row = _resolve_client(request.client_token or DEFAULT_CLIENT)
     client_id = client_row["id"]
     _ensure_client_access(scope, client_id)
@@ -235,59 +265,16 @@ async def generate_tenant_reports(
     )
     tenant_id = tenant_row["id"]
 
-    try:
-        loads_summary_path = (
-            Path(request.loads_summary_path) if request.loads_summary_path else None
-        )
-
-        from datetime import datetime
-        from backend.services.core.config import PHILIPPINES_TZ
-
-        cutoff_datetime = None
-        if request.cutoff_date and request.cutoff_time:
-            cutoff_datetime_str = f"{request.cutoff_date} {request.cutoff_time}"
-            try:
-                cutoff_datetime = datetime.strptime(cutoff_datetime_str, "%Y-%m-%d %H:%M")
-                cutoff_datetime = PHILIPPINES_TZ.localize(cutoff_datetime)
-            except ValueError as exc:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Invalid cutoff_date or cutoff_time format: {exc}",
-                ) from exc
-
-        start_datetime = None
-        if request.start_date and request.start_time:
-            start_datetime_str = f"{request.start_date} {request.start_time}"
-            try:
-                start_datetime = datetime.strptime(start_datetime_str, "%Y-%m-%d %H:%M")
-                start_datetime = PHILIPPINES_TZ.localize(start_datetime)
-            except ValueError as exc:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Invalid start_date or start_time format: {exc}",
-                ) from exc
-
-        end_datetime = None
-        if request.end_date and request.end_time:
-            end_datetime_str = f"{request.end_date} {request.end_time}"
-            try:
-                end_datetime = datetime.strptime(end_datetime_str, "%Y-%m-%d %H:%M")
-                end_datetime = PHILIPPINES_TZ.localize(end_datetime)
-            except ValueError as exc:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Invalid end_date or end_time format: {exc}",
-                ) from exc
+    cutoff_datetime = _parse_ph_datetime(request.cutoff_date, request.cutoff_time, "cutoff")
+    start_datetime = _parse_ph_datetime(request.start_date, request.start_time, "start")
+    end_datetime = _parse_ph_datetime(request.end_date, request.end_time, "end")
 
+    try:
         selected_load_ids: Optional[List[int]] = None
         if request.load_ids:
-            selected_load_ids = [
-                int(load_id)
-                for load_id in request.load_ids
-                if load_id is not None
-            ]
-            if not selected_load_ids:
-                raise HTTPException(status_code=400, detail="load_ids cannot be empty")
+            # List[int] is validated and coerced by pydantic-core when the body
+            # is parsed, so the list is used as is.
+            selected_load_ids = request.load_ids
         elif request.unit_id is not None:
             selected_load_ids = DbQueries.find_load_ids_by_unit(request.unit_id)
             if not selected_load_ids:
@@ -313,8 +300,9 @@ async def generate_tenant_reports(
             f"floor={request.floor if request.floor is not None else 'all'}, "
             f"unit_id={request.unit_id if request.unit_id is not None else 'all'}"
         )
-        background_tasks.add_task(
-            _execute_report_job,
+        job_id = submit_report_job(
+            owner_user_id=scope.user_id,
+            owner_client_id=client_id,
             tenant_id=tenant_id,
             client_id=client_id,
             client_name=client_row["name"],
@@ -338,28 +326,32 @@ async def generate_tenant_reports(
             "status": "started",
             "message": f"Report generation started for tenant: {tenant_row['name']}",
             "client": client_row["name"],
+            "job_id": job_id,
         }
+    except HTTPException:
+        raise
     except FileNotFoundError as exc:
         raise HTTPException(status_code=404, detail=str(exc))
     except Exception as exc:  # pragma: no cover
         raise HTTPException(status_code=500, detail=f"Failed to start report generation: {exc}")
 
 
-@reporting_router.post("/reports/client", response_model=dict)
-async def generate_client_reports(
+@reporting_router.post("/reports/client", response_model=dict, status_code=status.HTTP_202_ACCEPTED)
+def generate_client_reports(
     request: ClientReportRequest,
-    background_tasks: BackgroundTasks,
-    fastapi_request: Request,
+    scope: UserScope = Depends(_get_user_scope),
 ):
-    scope = _get_user_scope(fastapi_request)
+    from backend.services.domain.reporting import generate_reports_for_client
+
     try:
         loads_summary_path = (
             Path(request.loads_summary_path) if request.loads_summary_path else None
         )
 
-        background_tasks.add_task(
+        job_id = submit_background_job(
             generate_reports_for_client,
-            request.client_token,
+            owner_user_id=scope.user_id,
+            client_token=request.client_token,
             loads_summary_path=loads_summary_path,
         )
 
@@ -367,6 +359,7 @@ async def generate_client_reports(
             "status": "started",
             "message": f"Report generation started for client: {request.client_token}",
             "client": request.client_token,
+            "job_id": job_id,
         }
     except FileNotFoundError as exc:
         raise HTTPException(status_code=404, detail=str(exc))
@@ -380,25 +373,29 @@ class LastRecordsRequest(BaseModel):
     client_token: str = DEFAULT_CLIENT
     user_email: str  # Email to send report to
 
+    model_config = _REQUEST_MODEL_CONFIG
+
 
 class BillingInfoRequest(BaseModel):
     client_token: str = DEFAULT_CLIENT
     user_email: str  # Email to send report to
 
+    model_config = _REQUEST_MODEL_CONFIG
+
 
 class BillingComparisonRequest(BaseModel):
     client_token: str = DEFAULT_CLIENT
     user_email: str
 
+    model_config = _REQUEST_MODEL_CONFIG
+
 
-@reporting_router.post("/reports/generate_last_records", response_model=dict)
-async def generate_last_records(
+@reporting_router.post("/reports/generate_last_records", response_model=dict, status_code=status.HTTP_202_ACCEPTED)
+def generate_last_records(
     request: LastRecordsRequest,
-    background_tasks: BackgroundTasks,
-    fastapi_request: Request,
+    scope: UserScope = Depends(_get_user_scope),
 ):
     """Generate and email the last records CSV for a client."""
-    scope = _get_user_scope(fastapi_request)
     client_row = _resolve_client(request.client_token or DEFAULT_CLIENT)
     client_id = client_row["id"]
     _ensure_client_access(scope, client_id)
@@ -409,8 +406,12 @@ async def generate_last_records(
         f"email={request.user_email}"
     )
     
-    background_tasks.add_task(
+    from backend.services.domain.reporting import execute_last_records_job
+
+    job_id = submit_background_job(
         execute_last_records_job,
+        owner_user_id=scope.user_id,
+        owner_client_id=client_id,
         client_id=client_id,
         client_name=client_row["name"],
         user_email=request.user_email,
@@ -420,17 +421,16 @@ async def generate_last_records(
         "status": "started",
         "message": f"Last records generation started for client: {client_row['name']}",
         "client": client_row["name"],
+        "job_id": job_id,
     }
 
 
-@reporting_router.post("/reports/generate_billing_info", response_model=dict)
-async def generate_billing_info(
+@reporting_router.post("/reports/generate_billing_info", response_model=dict, status_code=status.HTTP_202_ACCEPTED)
+def generate_billing_info(
     request: BillingInfoRequest,
-    background_tasks: BackgroundTasks,
-    fastapi_request: Request,
+    scope: UserScope = Depends(_get_user_scope),
 ):
     """Generate and email the billing info CSV for a client."""
-    scope = _get_user_scope(fastapi_request)
     client_row = _resolve_client(request.client_token or DEFAULT_CLIENT)
     client_id = client_row["id"]
     _ensure_client_access(scope, client_id)
@@ -441,8 +441,12 @@ async def generate_billing_info(
         f"email={request.user_email}"
     )
     
-    background_tasks.add_task(
+    from backend.services.domain.reporting import execute_billing_info_job
+
+    job_id = submit_background_job(
         execute_billing_info_job,
+        owner_user_id=scope.user_id,
+        owner_client_id=client_id,
         client_id=client_id,
         client_name=client_row["name"],
         user_email=request.user_email,
@@ -452,6 +456,7 @@ async def generate_billing_info(
         "status": "started",
         "message": f"Billing info generation started for client: {client_row['name']}",
         "client": client_row["name"],
+        "job_id": job_id,
     }
 
 
@@ -460,14 +465,12 @@ async def debug_auth_scope():
     return {"AUTH_BYPASS_SCOPE": AUTH_BYPASS_SCOPE}
 
 
-@reporting_router.post("/reports/generate_billing_comparison", response_model=dict)
-async def generate_billing_comparison(
+@reporting_router.post("/reports/generate_billing_comparison", response_model=dict, status_code=status.HTTP_202_ACCEPTED)
+def generate_billing_comparison(
     request: BillingComparisonRequest,
-    background_tasks: BackgroundTasks,
-    fastapi_request: Request,
+    scope: UserScope = Depends(_get_user_scope),
 ):
     """Generate and email the billing comparison CSV for a client."""
-    scope = _get_user_scope(fastapi_request)
     client_row = _resolve_client(request.client_token or DEFAULT_CLIENT)
     client_id = client_row["id"]
     _ensure_client_access(scope, client_id)
@@ -478,8 +481,12 @@ async def generate_billing_comparison(
         f"email={request.user_email}"
     )
 
-    background_tasks.add_task(
+    from backend.services.domain.reporting import execute_billing_comparison_job
+
+    job_id = submit_background_job(
         execute_billing_comparison_job,
+        owner_user_id=scope.user_id,
+        owner_client_id=client_id,
         client_id=client_id,
         client_name=client_row["name"],
         user_email=request.user_email,
@@ -489,9 +496,24 @@ async def generate_billing_comparison(
         "status": "started",
         "message": f"Billing comparison generation started for client: {client_row['name']}",
         "client": client_row["name"],
+        "job_id": job_id,
     }
 
 
+@reporting_router.get("/reports/jobs/{job_id}", response_model=dict)
+def get_report_job_status(
+    job_id: str,
+    request: Request,
+    scope: UserScope = Depends(_get_user_scope),
+):
+    """Poll a job queued by one of the /reports endpoints."""
+    job = get_background_job(job_id, scope, unscoped=is_unscoped_request(request))
+    response = {"job_id": job_id, "status": job["status"]}
+    if job["status"] == "failed" and job["error"]:
+        response["error"] = job["error"]
+    return response
+
+
 class ClientSettingsRequest(BaseModel):
     client_token: str
     cutoff_day: int
@@ -499,9 +521,13 @@ class ClientSettingsRequest(BaseModel):
     cutoff_minute: int = 59
     cutoff_second: int = 59
 
+    model_config = _REQUEST_MODEL_CONFIG
+
 
 @reporting_router.post("/settings/client")
-async def update_client_settings(request: ClientSettingsRequest):
+def update_client_settings(request: ClientSettingsRequest):
+    from backend.services.domain.reporting.settings_helpers import set_client_settings
+
     try:
         set_client_settings(
             client_token=request.client_token,
@@ -510,6 +536,9 @@ async def update_client_settings(request: ClientSettingsRequest):
             cutoff_minute=request.cutoff_minute,
             cutoff_second=request.cutoff_second,
         )
+        invalidate_client_lookups()
+        _CUTOFF_CACHE.clear()
+        _TENANT_LAYOUT_CACHE.clear()
         return {"status": "success", "message": f"Settings updated for client: {request.client_token}"}
     except Exception as exc:  # pragma: no cover
         raise HTTPException(status_code=500, detail=f"Failed to update settings: {exc}")
@@ -523,9 +552,13 @@ class TenantSettingsRequest(BaseModel):
     cutoff_minute: Optional[int] = None
     cutoff_second: Optional[int] = None
 
+    model_config = _REQUEST_MODEL_CONFIG
+
 
 @reporting_router.post("/settings/tenant")
-async def update_tenant_settings(request: TenantSettingsRequest):
+def update_tenant_settings(request: TenantSettingsRequest):
+    from backend.services.domain.reporting.settings_helpers import set_tenant_settings
+
     try:
         set_tenant_settings(
             client_token=request.client_token,
@@ -535,6 +568,9 @@ async def update_tenant_settings(request: TenantSettingsRequest):
             cutoff_minute=request.cutoff_minute,
             cutoff_second=request.cutoff_second,
         )
+        invalidate_client_lookups()
+        _CUTOFF_CACHE.clear()
+        _TENANT_LAYOUT_CACHE.clear()
         return {
             "status": "success",
             "message": f"Settings updated for tenant: {request.client_token}/{request.tenant_token}",
@@ -544,24 +580,31 @@ async def update_tenant_settings(request: TenantSettingsRequest):
 
 
 @reporting_router.get("/settings/client/{client_token}")
-async def get_client_settings(client_token: str):
+def get_client_settings(request: Request, client_token: str):
+    from backend.services.domain.reporting.settings_helpers import get_all_client_settings
+
     try:
-        return get_all_client_settings(client_token)
+        return _etag_response(request, get_all_client_settings(client_token))
     except Exception as exc:  # pragma: no cover
         raise HTTPException(status_code=500, detail=f"Failed to get settings: {exc}")
 
 
 @reporting_router.get("/settings/cutoff")
-async def get_cutoff_settings(
+def get_cutoff_settings(
     client_token: str,
     tenant_token: Optional[str] = None,
     load_name: Optional[str] = None,
 ):
+    from backend.services.domain.reporting.settings_helpers import get_cutoff_datetime
+
     try:
-        cutoff_dt = get_cutoff_datetime(
-            client_token=client_token,
-            tenant_token=tenant_token,
-            load_name=load_name,
+        cutoff_dt = _CUTOFF_CACHE.get_or_set(
+            (client_token, tenant_token, load_name),
+            lambda: get_cutoff_datetime(
+                client_token=client_token,
+                tenant_token=tenant_token,
+                load_name=load_name,
+            ),
         )
 
         if cutoff_dt is None:
@@ -8,17 +8,28 @@ Uses JSON config for role definitions, database for user data.
 
 from __future__ import annotations
 
-from typing import List, Optional
+import sqlite3
+from typing import Any, Dict, List, Optional, Tuple
 from datetime import datetime
 
-from fastapi import APIRouter, HTTPException, Query, Request, status
+from fastapi import APIRouter, HTTPException, Query, Request, Response, status
 from pydantic import BaseModel, EmailStr, Field
 
+from backend.api.api_helpers import ORJSONResponse, invalidate_user_scope
+from backend.middleware.auth_middleware import invalidate_user_auth
 from backend.services.auth.permissions import UserRole, require_roles, get_user_role_from_request, APP_PERMISSIONS
-from backend.services.data.db_manager.db_schema import get_db_connection
+from backend.services.data.db_manager.db_schema import db_connection
 from backend.services.settings.app_config import AppConfigManager
 
-user_router = APIRouter(prefix="/settings/users", tags=["User Management"])
+user_router = APIRouter(
+    prefix="/settings/users",
+    tags=["User Management"],
+    default_response_class=ORJSONResponse,
+)
+
+# Shared so the parsed app_settings.json is reused across requests; the manager
+# reloads it only when the file changes.
+_APP_CONFIG = AppConfigManager()
 
 
 # ============================================================================
@@ -95,9 +106,114 @@ class RolesResponse(BaseModel):
 # User CRUD Endpoints
 # ============================================================================
 
+# The endpoints that touch the database are plain ``def`` so FastAPI runs the
+# blocking sqlite3 calls in its threadpool instead of on the event loop.
+# They return ORJSONResponse instances built from plain dicts:
+# rows come straight from our own schema, so FastAPI's response_model
+# validation is skipped. The response models still document the OpenAPI schema.
+
+# Column order of every users SELECT below; _user_item relies on it.
+_USER_FIELDS = (
+    "id", "email", "first_name", "last_name", "company", "position",
+    "mobile_phone", "landline", "user_group", "entity_id",
+    "receive_reports_email", "active", "created_at", "updated_at",
+)
+_USER_COLUMNS = ", ".join(_USER_FIELDS)
+
+_SELECT_USER_BY_ID_SQL = f"SELECT {_USER_COLUMNS} FROM users WHERE id = ?"
+
+# WHERE clauses for list_users keyed by (active_only, has user_group filter).
+_USER_FILTERS = {
+    (False, False): "",
+    (True, False): " WHERE active = 1",
+    (False, True): " WHERE user_group = ?1",
+    (True, True): " WHERE active = 1 AND user_group = ?1",
+}
+_COUNT_USERS_SQL = {
+    key: f"SELECT COUNT(*) FROM users{where}" for key, where in _USER_FILTERS.items()
+}
+# The total rides along with the page as an uncorrelated subquery (evaluated
+# once, from the covering users indexes), so the page itself can walk
+# idx_users_active_*_name in order instead of sorting the filtered set.
+# _COUNT_USERS_SQL is only needed for pages past the end.
+_LIST_USERS_SQL = {
+    key: (
+        f"SELECT {_USER_COLUMNS}, ({_COUNT_USERS_SQL[key]}) AS total FROM users{where} "
+        "ORDER BY last_name, first_name LIMIT ?2 OFFSET ?3"
+    )
+    for key, where in _USER_FILTERS.items()
+}
+
+# The entity check is folded into each write: a row referencing a missing
+# entity is simply not written, so RETURNING yields nothing. The
+# users.entity_id foreign key cannot be relied on (foreign_keys is off and
+# older databases added the column via ALTER TABLE).
+_ENTITY_EXISTS = "(?{n} IS NULL OR EXISTS (SELECT 1 FROM entities WHERE id = ?{n}))"
+
+_INSERT_USER_SQL = f"""
+    INSERT INTO users (
+        email, first_name, last_name, company, position,
+        mobile_phone, landline, user_group, entity_id,
+        receive_reports_email, active
+    )
+    SELECT ?1, ?2, ?3, ?4, ?5, ?6, ?7, ?8, ?9, ?10, ?11
+    WHERE {_ENTITY_EXISTS.format(n=9)}
+    RETURNING {_USER_COLUMNS}
+"""
+
+_UPDATE_USER_SQL = f"""
+    UPDATE users SET
+        first_name = COALESCE(?1, first_name),
+        last_name = COALESCE(?2, last_name),
+        company = COALESCE(?3, company),
+        position = COALESCE(?4, position),
+        mobile_phone = COALESCE(?5, mobile_phone),
+        landline = COALESCE(?6, landline),
+        user_group = COALESCE(?7, user_group),
+        entity_id = COALESCE(?8, entity_id),
+        receive_reports_email = COALESCE(?9, receive_reports_email),
+        active = COALESCE(?10, active),
+        updated_at = CURRENT_TIMESTAMP
+    WHERE id = ?11 AND {_ENTITY_EXISTS.format(n=8)}
+    RETURNING {_USER_COLUMNS}
+"""
+
+_DEACTIVATE_USER_SQL = (
+    "UPDATE users SET active = 0, updated_at = CURRENT_TIMESTAMP WHERE id = ? RETURNING id"
+)
+
+
+def _user_not_found(user_id: int) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail=f"User with ID {user_id} not found"
+    )
+
+
+def _entity_not_found(entity_id: Optional[int]) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail=f"Entity with ID {entity_id} not found"
+    )
+
+
+def _user_exists(cursor, user_id: int) -> bool:
+    return cursor.execute("SELECT 1 FROM users WHERE id = ?", (user_id,)).fetchone() is not None
+
+
+def _user_item(row: sqlite3.Row) -> Dict[str, Any]:
+    """Shape a users row exactly like ``UserResponse``."""
+    # Positional: rows start with the _USER_FIELDS columns (list_users adds a
+    # trailing total, which zip drops).
+    item = dict(zip(_USER_FIELDS, row))
+    item["receive_reports_email"] = bool(item["receive_reports_email"])
+    item["active"] = bool(item["active"])
+    return item
+
+
 @user_router.get("/", response_model=UserListResponse)
 @require_roles(*APP_PERMISSIONS["settings"])
-async def list_users(
+def list_users(
     request: Request,
     active_only: bool = Query(True, description="Filter to active users only"),
     user_group: Optional[UserRole] = Query(None, description="Filter by user group"),
@@ -109,89 +225,39 @@ async def list_users(
     
     Requires: SUPER_ADMIN or CLIENT_ADMIN role.
     """
-    conn = get_db_connection()
-    try:
+    with db_connection() as conn:
         cursor = conn.cursor()
         
-        # Build query with filters
-        conditions = []
-        params = []
-        
-        if active_only:
-            conditions.append("active = ?")
-            params.append(1)
-        
-        if user_group:
-            conditions.append("user_group = ?")
-            params.append(user_group.value)
-        
-        where_clause = " WHERE " + " AND ".join(conditions) if conditions else ""
-        
-        # Get total count
-        cursor.execute(f"SELECT COUNT(*) FROM users{where_clause}", params)
-        total = cursor.fetchone()[0]
-        
-        # Get users
-        cursor.execute(
-            f"""
-            SELECT id, email, first_name, last_name, company, position,
-                   mobile_phone, landline, user_group, entity_id,
-                   receive_reports_email, active, created_at, updated_at
-            FROM users
-            {where_clause}
-            ORDER BY last_name, first_name
-            LIMIT ? OFFSET ?
-            """,
-            params + [limit, offset]
-        )
+        # One fixed statement per filter combination keeps the SQL text
+        # stable, so sqlite3's per-connection statement cache reuses the
+        # compiled statements instead of re-preparing them on every call.
+        filter_key = (active_only, user_group is not None)
+        group = user_group.value if user_group is not None else None
         
-        users = [
-            UserResponse(
-                id=row["id"],
-                email=row["email"],
-                first_name=row["first_name"],
-                last_name=row["last_name"],
-                company=row["company"],
-                position=row["position"],
-                mobile_phone=row["mobile_phone"],
-                landline=row["landline"],
-                user_group=row["user_group"],
-                entity_id=row["entity_id"],
-                receive_reports_email=bool(row["receive_reports_email"]),
-                active=bool(row["active"]),
-                created_at=row["created_at"],
-                updated_at=row["updated_at"],
-            )
-            for row in cursor.fetchall()
-        ]
+        cursor.execute(_LIST_USERS_SQL[filter_key], (group, limit, offset))
+        rows = cursor.fetchall()
+        if rows:
+            total = rows[0]["total"]
+        elif offset:
+            params = (group,) if group is not None else ()
+            total = cursor.execute(_COUNT_USERS_SQL[filter_key], params).fetchone()[0]
+        else:
+            total = 0
         
-        return UserListResponse(users=users, total=total)
-    
-    finally:
-        conn.close()
+        return ORJSONResponse({"users": [_user_item(row) for row in rows], "total": total})
 
 
-@user_router.get("/{user_id}", response_model=UserResponse)
+@user_router.get("/{user_id:int}", response_model=UserResponse)
 @require_roles(*APP_PERMISSIONS["settings"])
-async def get_user(request: Request, user_id: int):
+def get_user(request: Request, user_id: int):
     """
     Get a specific user by ID.
     
     Requires: SUPER_ADMIN or CLIENT_ADMIN role.
     """
-    conn = get_db_connection()
-    try:
+    with db_connection() as conn:
         cursor = conn.cursor()
-        cursor.execute(
-            """
-            SELECT id, email, first_name, last_name, company, position,
-                   mobile_phone, landline, user_group, entity_id,
-                   receive_reports_email, active, created_at, updated_at
-            FROM users
-            WHERE id = ?
-            """,
-            (user_id,)
-        )
+        cursor.execute(_SELECT_USER_BY_ID_SQL, (user_id,))
         
         row = cursor.fetchone()
         if not row:
@@ -200,301 +266,184 @@ async def get_user(request: Request, user_id: int):
                 detail=f"User with ID {user_id} not found"
             )
         
-        return UserResponse(
-            id=row["id"],
-            email=row["email"],
-            first_name=row["first_name"],
-            last_name=row["last_name"],
-            company=row["company"],
-            position=row["position"],
-            mobile_phone=row["mobile_phone"],
-            landline=row["landline"],
-            user_group=row["user_group"],
-            entity_id=row["entity_id"],
-            receive_reports_email=bool(row["receive_reports_email"]),
-            active=bool(row["active"]),
-            created_at=row["created_at"],
-            updated_at=row["updated_at"],
-        )
-    
-    finally:
-        conn.close()
+        return ORJSONResponse(_user_item(row))
 
 
 @user_router.post("/", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
 @require_roles(*APP_PERMISSIONS["settings"])
-async def create_user(request: Request, user_data: UserCreateRequest):
+def create_user(request: Request, user_data: UserCreateRequest):
     """
     Create a new user.
     
     Requires: SUPER_ADMIN or CLIENT_ADMIN role.
     """
-    conn = get_db_connection()
-    try:
-        cursor = conn.cursor()
-        
-        # Check if email already exists
-        cursor.execute("SELECT id FROM users WHERE email = ?", (user_data.email,))
-        if cursor.fetchone():
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"User with email {user_data.email} already exists"
-            )
-        
-        # Validate entity_id if provided
-        if user_data.entity_id:
-            cursor.execute("SELECT id FROM entities WHERE id = ?", (user_data.entity_id,))
-            if not cursor.fetchone():
+    with db_connection() as conn:
+        try:
+            cursor = conn.cursor()
+        
+            try:
+                cursor.execute(
+                    _INSERT_USER_SQL,
+                    (
+                        user_data.email,
+                        user_data.first_name,
+                        user_data.last_name,
+                        user_data.company,
+                        user_data.position,
+                        user_data.mobile_phone,
+                        user_data.landline,
+                        user_data.user_group.value,
+                        user_data.entity_id,
+                        1 if user_data.receive_reports_email else 0,
+                        1 if user_data.active else 0,
+                    )
+                )
+            except sqlite3.IntegrityError as e:
+                if "users.email" not in str(e):
+                    raise
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Entity with ID {user_data.entity_id} not found"
+                    detail=f"User with email {user_data.email} already exists"
                 )
         
-        # Insert user
-        cursor.execute(
-            """
-            INSERT INTO users (
-                email, first_name, last_name, company, position,
-                mobile_phone, landline, user_group, entity_id,
-                receive_reports_email, active
-            )
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                user_data.email,
-                user_data.first_name,
-                user_data.last_name,
-                user_data.company,
-                user_data.position,
-                user_data.mobile_phone,
-                user_data.landline,
-                user_data.user_group.value,
-                user_data.entity_id,
-                1 if user_data.receive_reports_email else 0,
-                1 if user_data.active else 0,
-            )
-        )
-        
-        user_id = cursor.lastrowid
-        conn.commit()
-        
-        # Fetch created user
-        cursor.execute(
-            """
-            SELECT id, email, first_name, last_name, company, position,
-                   mobile_phone, landline, user_group, entity_id,
-                   receive_reports_email, active, created_at, updated_at
-            FROM users
-            WHERE id = ?
-            """,
-            (user_id,)
-        )
-        
-        row = cursor.fetchone()
-        return UserResponse(
-            id=row["id"],
-            email=row["email"],
-            first_name=row["first_name"],
-            last_name=row["last_name"],
-            company=row["company"],
-            position=row["position"],
-            mobile_phone=row["mobile_phone"],
-            landline=row["landline"],
-            user_group=row["user_group"],
-            entity_id=row["entity_id"],
-            receive_reports_email=bool(row["receive_reports_email"]),
-            active=bool(row["active"]),
-            created_at=row["created_at"],
-            updated_at=row["updated_at"],
-        )
+            row = cursor.fetchone()
+            if row is None:
+                raise _entity_not_found(user_data.entity_id)
+            conn.commit()
+            # A request may have cached this id as unknown before it existed.
+            invalidate_user_auth(row["id"])
+            return ORJSONResponse(_user_item(row), status_code=status.HTTP_201_CREATED)
     
-    except HTTPException:
-        raise
-    except Exception as e:
-        conn.rollback()
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to create user: {str(e)}"
-        )
-    finally:
-        conn.close()
+        except HTTPException:
+            raise
+        except Exception as e:
+            conn.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to create user: {str(e)}"
+            )
 
 
-@user_router.put("/{user_id}", response_model=UserResponse)
+@user_router.put("/{user_id:int}", response_model=UserResponse)
 @require_roles(*APP_PERMISSIONS["settings"])
-async def update_user(request: Request, user_id: int, user_data: UserUpdateRequest):
+def update_user(request: Request, user_id: int, user_data: UserUpdateRequest):
     """
     Update an existing user.
     
     Requires: SUPER_ADMIN or CLIENT_ADMIN role.
     """
-    conn = get_db_connection()
-    try:
-        cursor = conn.cursor()
+    with db_connection() as conn:
+        try:
+            cursor = conn.cursor()
         
-        # Check if user exists
-        cursor.execute("SELECT id FROM users WHERE id = ?", (user_id,))
-        if not cursor.fetchone():
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"User with ID {user_id} not found"
-            )
-        
-        # Validate entity_id if provided
-        if user_data.entity_id is not None:
-            cursor.execute("SELECT id FROM entities WHERE id = ?", (user_data.entity_id,))
-            if not cursor.fetchone():
+            if not user_data.model_dump(exclude_none=True):
+                if not _user_exists(cursor, user_id):
+                    raise _user_not_found(user_id)
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Entity with ID {user_data.entity_id} not found"
+                    detail="No fields to update"
                 )
         
-        # Build update query dynamically
-        updates = []
-        params = []
-        
-        if user_data.first_name is not None:
-            updates.append("first_name = ?")
-            params.append(user_data.first_name)
-        
-        if user_data.last_name is not None:
-            updates.append("last_name = ?")
-            params.append(user_data.last_name)
-        
-        if user_data.company is not None:
-            updates.append("company = ?")
-            params.append(user_data.company)
-        
-        if user_data.position is not None:
-            updates.append("position = ?")
-            params.append(user_data.position)
-        
-        if user_data.mobile_phone is not None:
-            updates.append("mobile_phone = ?")
-            params.append(user_data.mobile_phone)
-        
-        if user_data.landline is not None:
-            updates.append("landline = ?")
-            params.append(user_data.landline)
-        
-        if user_data.user_group is not None:
-            updates.append("user_group = ?")
-            params.append(user_data.user_group.value)
-        
-        if user_data.entity_id is not None:
-            updates.append("entity_id = ?")
-            params.append(user_data.entity_id)
-        
-        if user_data.receive_reports_email is not None:
-            updates.append("receive_reports_email = ?")
-            params.append(1 if user_data.receive_reports_email else 0)
-        
-        if user_data.active is not None:
-            updates.append("active = ?")
-            params.append(1 if user_data.active else 0)
-        
-        if not updates:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="No fields to update"
+            # None leaves the column unchanged, so one fixed statement covers
+            # every combination of fields.
+            cursor.execute(
+                _UPDATE_USER_SQL,
+                (
+                    user_data.first_name,
+                    user_data.last_name,
+                    user_data.company,
+                    user_data.position,
+                    user_data.mobile_phone,
+                    user_data.landline,
+                    user_data.user_group.value if user_data.user_group is not None else None,
+                    user_data.entity_id,
+                    *(
+                        None if flag is None else int(flag)
+                        for flag in (user_data.receive_reports_email, user_data.active)
+                    ),
+                    user_id,
+                ),
             )
         
-        updates.append("updated_at = CURRENT_TIMESTAMP")
-        params.append(user_id)
-        
-        cursor.execute(
-            f"UPDATE users SET {', '.join(updates)} WHERE id = ?",
-            params
-        )
-        
-        conn.commit()
-        
-        # Fetch updated user
-        cursor.execute(
-            """
-            SELECT id, email, first_name, last_name, company, position,
-                   mobile_phone, landline, user_group, entity_id,
-                   receive_reports_email, active, created_at, updated_at
-            FROM users
-            WHERE id = ?
-            """,
-            (user_id,)
-        )
-        
-        row = cursor.fetchone()
-        return UserResponse(
-            id=row["id"],
-            email=row["email"],
-            first_name=row["first_name"],
-            last_name=row["last_name"],
-            company=row["company"],
-            position=row["position"],
-            mobile_phone=row["mobile_phone"],
-            landline=row["landline"],
-            user_group=row["user_group"],
-            entity_id=row["entity_id"],
-            receive_reports_email=bool(row["receive_reports_email"]),
-            active=bool(row["active"]),
-            created_at=row["created_at"],
-            updated_at=row["updated_at"],
-        )
+            row = cursor.fetchone()
+            if row is None:
+                # Rare path: find out which of the two guards failed.
+                if not _user_exists(cursor, user_id):
+                    raise _user_not_found(user_id)
+                raise _entity_not_found(user_data.entity_id)
+            conn.commit()
+            invalidate_user_scope(user_id)
+            invalidate_user_auth(user_id)
+            return ORJSONResponse(_user_item(row))
     
-    except HTTPException:
-        raise
-    except Exception as e:
-        conn.rollback()
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to update user: {str(e)}"
-        )
-    finally:
-        conn.close()
+        except HTTPException:
+            raise
+        except Exception as e:
+            conn.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to update user: {str(e)}"
+            )
 
 
-@user_router.delete("/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
+@user_router.delete("/{user_id:int}", status_code=status.HTTP_204_NO_CONTENT)
 @require_roles(*APP_PERMISSIONS["settings/super_admin"])
-async def delete_user(request: Request, user_id: int):
+def delete_user(request: Request, user_id: int):
     """
     Delete a user (soft delete by setting active=False).
     
     Requires: SUPER_ADMIN role.
     """
-    conn = get_db_connection()
-    try:
-        cursor = conn.cursor()
-        
-        # Check if user exists
-        cursor.execute("SELECT id FROM users WHERE id = ?", (user_id,))
-        if not cursor.fetchone():
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"User with ID {user_id} not found"
-            )
+    with db_connection() as conn:
+        try:
+            cursor = conn.cursor()
         
-        # Soft delete (set active=False)
-        cursor.execute(
-            "UPDATE users SET active = 0, updated_at = CURRENT_TIMESTAMP WHERE id = ?",
-            (user_id,)
-        )
+            # Soft delete (set active=False)
+            if cursor.execute(_DEACTIVATE_USER_SQL, (user_id,)).fetchone() is None:
+                raise _user_not_found(user_id)
         
-        conn.commit()
+            conn.commit()
+            invalidate_user_scope(user_id)
+            invalidate_user_auth(user_id)
     
-    except HTTPException:
-        raise
-    except Exception as e:
-        conn.rollback()
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to delete user: {str(e)}"
-        )
-    finally:
-        conn.close()
+        except HTTPException:
+            raise
+        except Exception as e:
+            conn.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to delete user: {str(e)}"
+            )
 
 
 # ============================================================================
 # Role & Permission Management Endpoints
 # ============================================================================
 
+# (roles config, shaped roles, encoded RolesResponse body). Rebuilt only when
+# _APP_CONFIG reloads the settings file, which hands back a new roles dict.
+_roles_snapshot: Optional[Tuple[Dict[str, Any], Dict[str, Dict[str, Any]], bytes]] = None
+
+
+def _get_roles_snapshot() -> Tuple[Dict[str, Dict[str, Any]], bytes]:
+    """Return the roles shaped like ``RoleInfoResponse`` and the encoded ``RolesResponse``."""
+    global _roles_snapshot
+    roles_config = _APP_CONFIG.get_roles_config()
+    snapshot = _roles_snapshot
+    if snapshot is None or snapshot[0] is not roles_config:
+        roles = {
+            role_key: {
+                "name": role_data["name"],
+                "description": role_data["description"],
+                "hierarchy": role_data["hierarchy"],
+                "permissions": role_data["permissions"],
+            }
+            for role_key, role_data in roles_config.items()
+        }
+        snapshot = _roles_snapshot = (roles_config, roles, ORJSONResponse({"roles": roles}).body)
+    return snapshot[1], snapshot[2]
+
+
 @user_router.get("/roles", response_model=RolesResponse)
 @require_roles(*APP_PERMISSIONS["settings/roles"])
 async def get_roles(request: Request):
@@ -503,20 +452,13 @@ async def get_roles(request: Request):
     
     Requires: SUPER_ADMIN, CLIENT_ADMIN, or CLIENT_MANAGER role.
     """
-    settings_manager = AppConfigManager()
-    roles_config = settings_manager.get_roles_config()
-    
-    roles = {
-        role_key: RoleInfoResponse(
-            name=role_data["name"],
-            description=role_data["description"],
-            hierarchy=role_data["hierarchy"],
-            permissions=role_data["permissions"],
-        )
-        for role_key, role_data in roles_config.items()
-    }
-    
-    return RolesResponse(roles=roles)
+    _, body = _get_roles_snapshot()
+    return Response(
+        body,
+        media_type="application/json",
+        # Role definitions only change on deploy; private because access is role-gated.
+        headers={"Cache-Control": "private, max-age=30"},
+    )
 
 
 @user_router.get("/roles/{role_name}", response_model=RoleInfoResponse)
@@ -527,20 +469,12 @@ async def get_role(request: Request, role_name: str):
     
     Requires: SUPER_ADMIN, CLIENT_ADMIN, or CLIENT_MANAGER role.
     """
-    settings_manager = AppConfigManager()
-    roles_config = settings_manager.get_roles_config()
-    
-    if role_name not in roles_config:
+    roles, _ = _get_roles_snapshot()
+    role = roles.get(role_name)
+    if role is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Role '{role_name}' not found"
         )
     
-    role_data = roles_config[role_name]
-    return RoleInfoResponse(
-        name=role_data["name"],
-        description=role_data["description"],
-        hierarchy=role_data["hierarchy"],
-        permissions=role_data["permissions"],
-    )
-
+    return ORJSONResponse(role)
@@ -8,6 +8,8 @@ import boto3
 cognito = boto3.client("cognito-idp")
 USER_POOL_ID = os.environ["USER_POOL_ID"]
 DEFAULT_GROUP = os.getenv("DEFAULT_GROUP", "viewer")
+# Fixed arguments of the group assignment, built once per container.
+GROUP_ARGS = {"UserPoolId": USER_POOL_ID, "GroupName": DEFAULT_GROUP}
 
 
 def handler(event, context):
@@ -31,11 +33,7 @@ def handler(event, context):
     
     try:
         # Add user to default group
-        cognito.admin_add_user_to_group(
-            UserPoolId=USER_POOL_ID,
-            Username=username,
-            GroupName=DEFAULT_GROUP,
-        )
+        cognito.admin_add_user_to_group(Username=username, **GROUP_ARGS)
     except Exception as e:
         # Log error but don't fail the confirmation
         print(f"Error adding user {username} to group {DEFAULT_GROUP}: {str(e)}")
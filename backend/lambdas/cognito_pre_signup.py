@@ -4,11 +4,12 @@ Rejects sign-ups from email domains not in the allowlist.
 """
 import os
 
-ALLOWLIST = {
+# Built once per container; warm invocations only do a set lookup.
+ALLOWLIST = frozenset(
     d.strip().lower()
     for d in os.getenv("ALLOWLIST_DOMAINS", "").split(",")
     if d.strip()
-}
+)
 
 
 def handler(event, context):
@@ -23,9 +24,9 @@ def handler(event, context):
         event: Modified event (or raises Exception if domain not allowed)
     """
     email = (event.get("request", {}).get("userAttributes", {}).get("email") or "").lower()
-    domain = email.split("@")[-1] if "@" in email else ""
+    _, at, domain = email.rpartition("@")
     
-    if not domain:
+    if not at or not domain:
         raise Exception("Invalid email address")
     
     if domain not in ALLOWLIST:
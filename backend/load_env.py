@@ -4,8 +4,12 @@ Utility to load environment variables from env.local file.
 """
 
 import os
+import re
 from pathlib import Path
 
+# KEY=VALUE lines; the key may not start with '#' (comments) or '='.
+_ENV_LINE_RE = re.compile(r"^[ \t]*([^#\s=][^=\n]*)=(.*)$", re.MULTILINE)
+
 
 def load_env_local():
     """Load environment variables from env.local file in project root."""
@@ -15,22 +19,14 @@ def load_env_local():
     if not env_file.exists():
         return False
     
-    with open(env_file, 'r') as f:
-        for line in f:
-            line = line.strip()
-            # Skip comments and empty lines
-            if not line or line.startswith('#'):
-                continue
-            
-            # Parse KEY=VALUE
-            if '=' in line:
-                key, value = line.split('=', 1)
-                key = key.strip()
-                value = value.strip().strip('"').strip("'")
-                
-                # Only set if not already set (don't override existing env vars)
-                if key and not os.getenv(key):
-                    os.environ[key] = value
+    # Comment and blank lines never match, so only KEY=VALUE lines are visited.
+    for match in _ENV_LINE_RE.finditer(env_file.read_text()):
+        key = match.group(1).strip()
+        value = match.group(2).strip().strip('"').strip("'")
+        
+        # Only set if not already set (don't override existing env vars)
+        if not os.environ.get(key):
+            os.environ[key] = value
     
     return True
 
@@ -4,110 +4,173 @@ Authentication middleware for FastAPI.
 
 Extracts user information from request and stores it in request.state
 for use by permission decorators.
+
+Implemented as a pure ASGI middleware (rather than ``BaseHTTPMiddleware``) so
+requests are not wrapped in an extra task / Request / Response round-trip.
 """
 
-from typing import Callable
+from typing import Optional, Tuple
+from urllib.parse import parse_qsl
 
-from fastapi import Request, status
-from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi import status
+from starlette.concurrency import run_in_threadpool
 from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
 
-from backend.services.data.db_manager.db_schema import get_db_connection
+from backend.services.core.cache import TTLCache
+from backend.services.data.db_manager.db_schema import db_connection
 from backend.services.auth.permissions import UserRole, check_permission
 
+# Endpoints that skip auth entirely.
+PUBLIC_PATHS = frozenset({
+    "/",
+    "/docs",
+    "/openapi.json",
+    "/redoc",
+    "/meters/v1/meta",
+    "/meters/v1/user-info",  # Public - used to get user info by email during login
+    "/meters/v1/user-id",    # Public - used to get user ID by email during login
+})
+
+# (role, authenticated) per user id. Every authenticated request needs this,
+# so it is cached briefly; user edits call invalidate_user_auth().
+_USER_AUTH_CACHE = TTLCache(maxsize=4096, ttl=10)
+
+
+def invalidate_user_auth(user_id: int) -> None:
+    """Drop the cached role/active lookup for a user (call after user updates)."""
+    _USER_AUTH_CACHE.pop(user_id)
+
+
+def _lookup_user_auth(user_id: int) -> Tuple[Optional[UserRole], bool]:
+    """Return ``(role, authenticated)`` for ``user_id``, cached for a few seconds."""
+    cached = _USER_AUTH_CACHE.get(user_id)
+    if cached is not None:
+        return cached
+
+    with db_connection() as conn:
+        row = conn.execute(
+            "SELECT user_group, active FROM users WHERE id = ? LIMIT 1",
+            (user_id,)
+        ).fetchone()
+
+    if row is None or not row["active"]:
+        result: Tuple[Optional[UserRole], bool] = (None, False)
+    else:
+        try:
+            result = (UserRole(row["user_group"]), True)
+        except ValueError:
+            # Invalid role, treat as unauthenticated
+            result = (None, True)
+    _USER_AUTH_CACHE.set(user_id, result)
+    return result
+
+
+def _parse_int(raw_value: Optional[str]) -> Optional[int]:
+    """Return ``raw_value`` as an int, or None when missing/invalid."""
+    if not raw_value:
+        return None
+    try:
+        # int() already ignores surrounding whitespace.
+        return int(raw_value)
+    except ValueError:
+        return None
+
+
+def _header_user_id(scope: Scope) -> Optional[str]:
+    """Read the raw user id header straight from the ASGI scope."""
+    fallback: Optional[str] = None
+    for name, value in scope["headers"]:
+        if name == b"x-user-id":
+            return value.decode("latin-1")
+        if name == b"x-userid" and fallback is None:
+            fallback = value.decode("latin-1")
+    return fallback
 
-class AuthMiddleware(BaseHTTPMiddleware):
+
+def _query_user_id(scope: Scope) -> Optional[str]:
+    """Read the ``user_id`` query parameter from the ASGI scope."""
+    query_string = scope.get("query_string", b"")
+    if b"user_id=" not in query_string:
+        return None
+    for key, value in parse_qsl(query_string.decode("latin-1"), keep_blank_values=True):
+        if key == "user_id":
+            return value
+    return None
+
+
+class AuthMiddleware:
     """
     Middleware to extract and validate user authentication.
-    
+
     Looks for user_id in:
     1. x-user-id header
     2. user_id query parameter
-    
+
     Then fetches user role from database and stores in request.state.
     Also enforces route-level permissions.
     """
-    
-    async def dispatch(self, request: Request, call_next: Callable):
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         # Skip auth for public endpoints
-        public_paths = [
-            "/", 
-            "/docs", 
-            "/openapi.json", 
-            "/redoc", 
-            "/meters/v1/meta",
-            "/meters/v1/user-info",  # Public - used to get user info by email during login
-            "/meters/v1/user-id",    # Public - used to get user ID by email during login
-        ]
-        if request.url.path in public_paths:
-            return await call_next(request)
-        
+        route_path = scope["path"]
+        # OPTIONS requests never carry credentials (CORS preflights are answered
+        # by CORSMiddleware before reaching us), so skip the user lookup.
+        if route_path in PUBLIC_PATHS or scope["method"] == "OPTIONS":
+            await self.app(scope, receive, send)
+            return
+
+        # request.state is backed by scope["state"]
+        state = scope.setdefault("state", {})
+
         # Extract user_id from header or query param
-        user_id = None
-        header_user_id = request.headers.get("x-user-id") or request.headers.get("x-userid")
-        if header_user_id:
-            try:
-                user_id = int(header_user_id.strip())
-            except ValueError:
-                pass
-        
+        user_id = _parse_int(_header_user_id(scope))
         if user_id is None:
-            query_user_id = request.query_params.get("user_id")
-            if query_user_id:
-                try:
-                    user_id = int(query_user_id.strip())
-                except ValueError:
-                    pass
-        
+            user_id = _parse_int(_query_user_id(scope))
+        # Parsed once here so API helpers (_get_user_scope) don't re-read headers.
+        state["parsed_user_id"] = user_id
+
         # If no user_id, allow request but mark as unauthenticated
         if user_id is None:
-            request.state.user_id = None
-            request.state.user_role = None
-            request.state.authenticated = False
-            return await call_next(request)
-        
+            state["user_id"] = None
+            state["user_role"] = None
+            state["authenticated"] = False
+            await self.app(scope, receive, send)
+            return
+
         # Fetch user role from database
         try:
-            conn = get_db_connection()
-            cursor = conn.cursor()
-            cursor.execute(
-                "SELECT user_group, active FROM users WHERE id = ? LIMIT 1",
-                (user_id,)
-            )
-            row = cursor.fetchone()
-            conn.close()
-            
-            if row is None or not row["active"]:
-                request.state.user_id = None
-                request.state.user_role = None
-                request.state.authenticated = False
-            else:
-                request.state.user_id = user_id
-                try:
-                    request.state.user_role = UserRole(row["user_group"])
-                except ValueError:
-                    # Invalid role, treat as unauthenticated
-                    request.state.user_role = None
-                request.state.authenticated = True
+            auth = _USER_AUTH_CACHE.get(user_id)
+            if auth is None:
+                # Cache miss: keep the blocking SQLite query off the event loop.
+                auth = await run_in_threadpool(_lookup_user_auth, user_id)
+            user_role, authenticated = auth
         except Exception:
             # Database error, allow request but mark as unauthenticated
-            request.state.user_id = None
-            request.state.user_role = None
-            request.state.authenticated = False
-        
+            user_role, authenticated = None, False
+        state["user_id"] = user_id if authenticated else None
+        state["user_role"] = user_role
+        state["authenticated"] = authenticated
+
         # Check route permissions if user is authenticated
-        if request.state.authenticated and request.state.user_role:
-            user_role = request.state.user_role
-            route_path = request.url.path
-            
+        user_role = state["user_role"]
+        if state["authenticated"] and user_role:
             # Check if user has permission for this route
             if not check_permission(user_role, route_path):
-                return JSONResponse(
+                response = JSONResponse(
                     status_code=status.HTTP_403_FORBIDDEN,
                     content={
                         "detail": f"Access denied. Role '{user_role.value}' does not have permission to access '{route_path}'"
                     }
                 )
-        
-        return await call_next(request)
+                await response(scope, receive, send)
+                return
 
+        await self.app(scope, receive, send)
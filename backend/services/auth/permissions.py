@@ -8,8 +8,10 @@ Provides:
 - Permission checking utilities
 """
 
+import inspect
+import re
 from enum import Enum
-from functools import wraps
+from functools import lru_cache, wraps
 from typing import Callable, List, Optional, Set
 
 from fastapi import HTTPException, Request, status
@@ -61,6 +63,7 @@ ROUTE_PERMISSIONS = {
     "/reports/generate_last_records": APP_PERMISSIONS["reports"],
     "/reports/generate_billing_info": APP_PERMISSIONS["reports"],
     "/reports/generate_billing_comparison": APP_PERMISSIONS["reports"],
+    "/reports/jobs/{job_id}": APP_PERMISSIONS["reports"],
     "/settings/client": APP_PERMISSIONS["settings"],
     "/settings/client/{client_token}": APP_PERMISSIONS["settings"],
     "/settings/tenant": APP_PERMISSIONS["settings"],
@@ -84,10 +87,20 @@ ROUTE_PERMISSIONS = {
     "/meters/v1/approvals": APP_PERMISSIONS["meters/approvals"],
     "/meters/v1/meter-records": APP_PERMISSIONS["meters"],
     # Note: /meters/v1/user-id, /meters/v1/user-info, and /meters/v1/meta are public endpoints
-    # (marked as public_paths in AuthMiddleware), so they don't need permissions here
+    # (listed in AuthMiddleware's PUBLIC_PATHS), so they don't need permissions here
 }
 
 
+# Roles that see every client / building regardless of entity assignments.
+# UserRole is a str enum, so membership works for enum members and raw strings.
+UNSCOPED_ROLES = frozenset({UserRole.SUPER_ADMIN})
+
+
+def is_unscoped_request(request: Request) -> bool:
+    """Return True when the authenticated role bypasses per-user scoping."""
+    return getattr(request.state, "user_role", None) in UNSCOPED_ROLES
+
+
 def get_user_role_from_request(request: Request) -> Optional[UserRole]:
     """
     Extract user role from request.
@@ -122,6 +135,9 @@ def require_roles(*allowed_roles: UserRole):
     """
     Decorator to require specific roles for an endpoint.
     
+    Works on both ``async def`` and plain ``def`` endpoints; the wrapper keeps
+    the endpoint's kind so FastAPI still runs sync endpoints in its threadpool.
+    
     Usage:
         @app.get("/admin")
         @require_roles(UserRole.SUPER_ADMIN, UserRole.CLIENT_ADMIN)
@@ -130,33 +146,41 @@ def require_roles(*allowed_roles: UserRole):
     """
     allowed_set = set(allowed_roles)
     
+    def check(args, kwargs) -> None:
+        # Find Request object in args/kwargs
+        request: Optional[Request] = None
+        for arg in args:
+            if isinstance(arg, Request):
+                request = arg
+                break
+        if request is None:
+            request = kwargs.get("request")
+        
+        if request is None:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Request object not found",
+            )
+        
+        user_role = get_user_role_from_request(request)
+        
+        if not has_role(user_role, allowed_set):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail=f"Access denied. Required roles: {[r.value for r in allowed_roles]}",
+            )
+    
     def decorator(func: Callable):
-        @wraps(func)
-        async def wrapper(*args, **kwargs):
-            # Find Request object in args/kwargs
-            request: Optional[Request] = None
-            for arg in args:
-                if isinstance(arg, Request):
-                    request = arg
-                    break
-            if request is None:
-                request = kwargs.get("request")
-            
-            if request is None:
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail="Request object not found",
-                )
-            
-            user_role = get_user_role_from_request(request)
-            
-            if not has_role(user_role, allowed_set):
-                raise HTTPException(
-                    status_code=status.HTTP_403_FORBIDDEN,
-                    detail=f"Access denied. Required roles: {[r.value for r in allowed_roles]}",
-                )
-            
-            return await func(*args, **kwargs)
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def wrapper(*args, **kwargs):
+                check(args, kwargs)
+                return await func(*args, **kwargs)
+        else:
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                check(args, kwargs)
+                return func(*args, **kwargs)
         
         return wrapper
     return decorator
@@ -203,6 +227,48 @@ def require_minimum_role(minimum_role: UserRole):
     return decorator
 
 
+def _compile_route_pattern(route_pattern: str) -> "re.Pattern[str]":
+    """Turn ``/a/{param}/b`` into a regex where each ``{param}`` matches digits."""
+    pattern = route_pattern.replace("{", "(?P<").replace("}", ">\\d+)")
+    return re.compile("^" + pattern.replace("/", "\\/") + "$")
+
+
+# Compiled once instead of rebuilding every regex on each request. Both lists
+# keep ROUTE_PERMISSIONS order, which decides the winner when several match.
+# e.g. "/meters/v1/buildings/123/tenants" matches "/meters/v1/buildings/{building_id}/tenants"
+_ROUTE_PATTERNS = [
+    (_compile_route_pattern(route_pattern), allowed_roles)
+    for route_pattern, allowed_roles in ROUTE_PERMISSIONS.items()
+]
+# Path parameters stripped for prefix matching of nested routes,
+# e.g. "/meters/v1/buildings/123/tenants" under "/meters/v1/buildings"
+_ROUTE_PREFIXES = [
+    (route_prefix.split("{")[0].rstrip("/"), allowed_roles)
+    for route_prefix, allowed_roles in ROUTE_PERMISSIONS.items()
+]
+
+
+@lru_cache(maxsize=4096)
+def _allowed_roles_for_route(route: str) -> Optional[Set[UserRole]]:
+    """Resolve the allowed roles for a concrete route path (None if unmapped)."""
+    # Check exact route match
+    allowed_roles = ROUTE_PERMISSIONS.get(route)
+    if allowed_roles is not None:
+        return allowed_roles
+    
+    # Check pattern matches (for routes with path parameters)
+    for pattern, allowed_roles in _ROUTE_PATTERNS:
+        if pattern.match(route):
+            return allowed_roles
+    
+    # Check prefix matches (for nested routes)
+    for clean_prefix, allowed_roles in _ROUTE_PREFIXES:
+        if route.startswith(clean_prefix + "/") or route == clean_prefix:
+            return allowed_roles
+    
+    return None
+
+
 def check_permission(user_role: Optional[UserRole], route: str) -> bool:
     """
     Check if user has permission for a route.
@@ -217,28 +283,9 @@ def check_permission(user_role: Optional[UserRole], route: str) -> bool:
     if user_role is None:
         return False
     
-    # Check exact route match
-    if route in ROUTE_PERMISSIONS:
-        return user_role in ROUTE_PERMISSIONS[route]
-    
-    # Check pattern matches (for routes with path parameters)
-    # e.g., "/meters/v1/buildings/123/tenants" should match "/meters/v1/buildings/{building_id}/tenants"
-    import re
-    for route_pattern, allowed_roles in ROUTE_PERMISSIONS.items():
-        # Convert pattern to regex (replace {param} with \d+)
-        pattern = route_pattern.replace("{", "(?P<").replace("}", ">\\d+)")
-        pattern = "^" + pattern.replace("/", "\\/") + "$"
-        if re.match(pattern, route):
-            return user_role in allowed_roles
-    
-    # Check prefix matches (for nested routes)
-    # e.g., "/meters/v1/buildings/123/tenants" should match "/meters/v1/buildings"
-    for route_prefix, allowed_roles in ROUTE_PERMISSIONS.items():
-        # Remove path parameters for prefix matching
-        clean_prefix = route_prefix.split("{")[0].rstrip("/")
-        if route.startswith(clean_prefix + "/") or route == clean_prefix:
-            return user_role in allowed_roles
-    
+    allowed_roles = _allowed_roles_for_route(route)
     # Default: deny access if route not in permissions map
-    return False
+    if allowed_roles is None:
+        return False
+    return user_role in allowed_roles
 
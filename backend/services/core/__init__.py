@@ -2,6 +2,7 @@
 """Core utilities and base classes."""
 
 from backend.services.core.base import ServiceContext
+from backend.services.core.cache import TTLCache
 from backend.services.core.config import (
     MAX_MISSING_DAYS_PER_MONTH,
     MAX_CONSECUTIVE_MISSING_TIMESTAMPS,
@@ -36,6 +37,7 @@ __all__ = [
     
     # Logger and utilities
     'ReportLogger',
+    'TTLCache',
     'raise_with_context',
     'generate_power_column_name',
     'generate_consumption_column_name',
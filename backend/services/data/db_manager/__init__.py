@@ -4,6 +4,7 @@ Database manager package exports.
 """
 
 from backend.services.data.db_manager.db_schema import (
+    db_connection,
     get_db_connection,
     init_database,
     create_default_stratcon_epc,
@@ -20,6 +21,7 @@ class DbQueries(ReportingDbQueries, MeterLoggingDbQueries):
     pass
 
 __all__ = [
+    'db_connection',
     'get_db_connection',
     'init_database',
     'create_default_stratcon_epc',
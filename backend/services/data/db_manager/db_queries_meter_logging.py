@@ -6,9 +6,9 @@ from __future__ import annotations
 import sqlite3
 from collections import defaultdict
 from datetime import datetime
-from typing import Dict, Iterable, List, Optional, Set, Tuple, cast
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple, cast
 
-from backend.services.data.db_manager.db_schema import get_db_connection
+from backend.services.data.db_manager.db_schema import SQL_PARAM_CHUNK_SIZE, get_db_connection
 from backend.services.core.utils import ReportLogger
 
 
@@ -56,6 +56,29 @@ class MeterLoggingDbQueries:
             if close_conn:
                 conn.close()
 
+    @staticmethod
+    def get_active_user_by_email(
+        email: str,
+        conn: Optional[sqlite3.Connection] = None,
+    ) -> Optional[Dict[str, object]]:
+        """Return ``id``, ``user_group``, ``entity_id`` and ``company`` for an active user, or None."""
+        close_conn = False
+        if conn is None:
+            conn = get_db_connection()
+            close_conn = True
+
+        try:
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT id, user_group, entity_id, company FROM users WHERE email = ? AND active = 1 LIMIT 1",
+                (email,),
+            )
+            row = cursor.fetchone()
+            return dict(row) if row is not None else None
+        finally:
+            if close_conn:
+                conn.close()
+
     @staticmethod
     def get_meter_pk_for_identifier(
         meter_identifier: str,
@@ -84,6 +107,55 @@ class MeterLoggingDbQueries:
             if close_conn:
                 conn.close()
 
+    @staticmethod
+    def get_meter_pks_for_identifiers(
+        meter_identifiers: Iterable[str],
+        conn: Optional[sqlite3.Connection] = None,
+    ) -> Dict[str, int]:
+        """Resolve many client-facing meter identifiers in one query.
+
+        Returns ``{identifier: meter_pk}``; unknown identifiers are omitted.
+        """
+        wanted = sorted({identifier for identifier in meter_identifiers if identifier})
+        if not wanted:
+            return {}
+
+        close_conn = False
+        if conn is None:
+            conn = get_db_connection()
+            close_conn = True
+
+        try:
+            cursor = conn.cursor()
+            by_ref: Dict[str, int] = {}
+            by_meter_id: Dict[str, int] = {}
+            # Each identifier is bound twice (meter_id and meter_ref).
+            chunk_size = SQL_PARAM_CHUNK_SIZE // 2
+            for start in range(0, len(wanted), chunk_size):
+                chunk = wanted[start:start + chunk_size]
+                placeholders = ",".join("?" * len(chunk))
+                cursor.execute(
+                    f"""
+                    SELECT id, meter_id, meter_ref
+                    FROM meters
+                    WHERE meter_id IN ({placeholders}) OR meter_ref IN ({placeholders})
+                    """,
+                    (*chunk, *chunk),
+                )
+                for row in cursor.fetchall():
+                    if row["meter_ref"] is not None:
+                        by_ref.setdefault(row["meter_ref"], row["id"])
+                    if row["meter_id"] is not None:
+                        by_meter_id.setdefault(row["meter_id"], row["id"])
+            wanted_set = set(wanted)
+            # A match on meter_id wins over one on meter_ref.
+            mapping = {ref: pk for ref, pk in by_ref.items() if ref in wanted_set}
+            mapping.update((mid, pk) for mid, pk in by_meter_id.items() if mid in wanted_set)
+            return mapping
+        finally:
+            if close_conn:
+                conn.close()
+
     @staticmethod
     def list_all_buildings(
         conn: Optional[sqlite3.Connection] = None,
@@ -101,6 +173,65 @@ class MeterLoggingDbQueries:
             if close_conn:
                 conn.close()
 
+    @staticmethod
+    def _query_tenant_summaries(
+        cursor: sqlite3.Cursor,
+        where_clause: str,
+        params: Tuple[object, ...],
+    ) -> List[Dict[str, object]]:
+        """Return tenant summaries (building, floors, units, last record) in a single query.
+
+        ``last_record_at`` is a correlated MAX per assigned meter, served by the
+        ``(meter_id, timestamp_record)`` index, so meter_records rows are never
+        joined into (and multiplied across) the aggregate.
+        """
+        cursor.execute(
+            f"""
+            SELECT
+                t.id AS tenant_id,
+                t.name AS tenant_name,
+                b.id AS building_id,
+                b.name AS building_name,
+                b.client_id,
+                MIN(u.floor) AS floor,
+                COUNT(DISTINCT u.floor) AS number_of_floors,
+                COUNT(DISTINCT u.id) AS active_units,
+                MAX(
+                    (
+                        SELECT MAX(mr.timestamp_record)
+                        FROM meter_records AS mr
+                        WHERE mr.meter_id = umh.meter_id
+                    )
+                ) AS last_record_at
+            FROM unit_tenants_history AS uth
+            JOIN tenants AS t ON uth.tenant_id = t.id
+            JOIN units AS u ON uth.unit_id = u.id
+            JOIN buildings AS b ON u.building_id = b.id
+            LEFT JOIN unit_meters_history AS umh ON umh.unit_id = u.id AND umh.is_active = 1
+            WHERE uth.is_active = 1
+              AND {where_clause}
+            GROUP BY t.id, b.id
+            ORDER BY b.name, t.name
+            """,
+            params,
+        )
+        return [
+            {
+                "tenant_id": row["tenant_id"],
+                "tenant_name": row["tenant_name"],
+                "client_id": row["client_id"],
+                "building": {
+                    "id": row["building_id"],
+                    "name": row["building_name"],
+                    "floor": row["floor"],
+                },
+                "number_of_floors": row["number_of_floors"] or 0,
+                "active_units": row["active_units"] or 0,
+                "last_record_at": row["last_record_at"],
+            }
+            for row in cursor.fetchall()
+        ]
+
     @staticmethod
     def list_tenants_for_building(
         building_id: int,
@@ -121,50 +252,11 @@ class MeterLoggingDbQueries:
             close_conn = True
 
         try:
-            cursor = conn.cursor()
-            cursor.execute(
-                """
-                SELECT
-                    t.id AS tenant_id,
-                    t.name AS tenant_name,
-                    b.id AS building_id,
-                    b.name AS building_name,
-                    b.client_id,
-                    COUNT(DISTINCT u.floor) AS number_of_floors,
-                    COUNT(DISTINCT u.id) AS active_units,
-                    MAX(mr.timestamp_record) AS last_record_at
-                FROM unit_tenants_history AS uth
-                JOIN tenants AS t ON uth.tenant_id = t.id
-                JOIN units AS u ON uth.unit_id = u.id
-                JOIN buildings AS b ON u.building_id = b.id
-                LEFT JOIN unit_meters_history AS umh ON umh.unit_id = u.id AND umh.is_active = 1
-                LEFT JOIN meter_records AS mr ON mr.meter_id = umh.meter_id
-                WHERE uth.is_active = 1
-                  AND b.id = ?
-                GROUP BY t.id, b.id
-                ORDER BY b.name, t.name
-                """,
+            summaries = MeterLoggingDbQueries._query_tenant_summaries(
+                conn.cursor(),
+                "b.id = ?",
                 (building_id,),
             )
-
-            rows = cursor.fetchall()
-            summaries: List[Dict[str, object]] = []
-            for row in rows:
-                summaries.append(
-                    {
-                        "tenant_id": row["tenant_id"],
-                        "tenant_name": row["tenant_name"],
-                        "client_id": row["client_id"],
-                        "building": {
-                            "id": row["building_id"],
-                            "name": row["building_name"],
-                        },
-                        "number_of_floors": row["number_of_floors"] or 0,
-                        "active_units": row["active_units"] or 0,
-                        "last_record_at": row["last_record_at"],
-                    }
-                )
-
             logger_obj.debug(
                 f"Tenant summary query for building {building_id} "
                 f"returned {len(summaries)} rows"
@@ -174,6 +266,32 @@ class MeterLoggingDbQueries:
             if close_conn:
                 conn.close()
 
+    @staticmethod
+    def list_tenant_summaries_for_client(
+        client_id: int,
+        building_id: Optional[int] = None,
+        conn: Optional[sqlite3.Connection] = None,
+    ) -> List[Dict[str, object]]:
+        """Return tenant summaries for a client, optionally limited to one building."""
+        if client_id is None:
+            raise ValueError("client_id cannot be None")
+
+        close_conn = False
+        if conn is None:
+            conn = get_db_connection()
+            close_conn = True
+
+        try:
+            where_clause = "b.client_id = ?"
+            params: Tuple[object, ...] = (client_id,)
+            if building_id is not None:
+                where_clause += " AND b.id = ?"
+                params += (building_id,)
+            return MeterLoggingDbQueries._query_tenant_summaries(conn.cursor(), where_clause, params)
+        finally:
+            if close_conn:
+                conn.close()
+
     @staticmethod
     def _get_meter_ids_for_tenant(
         tenant_id: int,
@@ -967,6 +1085,38 @@ class MeterLoggingDbQueries:
             logger = ReportLogger()
         logger_obj: ReportLogger = cast(ReportLogger, logger)
 
+        records = list(
+            MeterLoggingDbQueries.iter_meter_records(
+                tenant_id=tenant_id,
+                meter_id=meter_id,
+                from_timestamp=from_timestamp,
+                to_timestamp=to_timestamp,
+                limit=limit,
+                conn=conn,
+            )
+        )
+        logger_obj.debug(
+            f"Fetched {len(records)} meter records (tenant={tenant_id}, meter={meter_id})"
+        )
+        return records
+
+    @staticmethod
+    def iter_meter_records(
+        tenant_id: Optional[int] = None,
+        meter_id: Optional[int] = None,
+        from_timestamp: Optional[str] = None,
+        to_timestamp: Optional[str] = None,
+        limit: Optional[int] = None,
+        conn: Optional[sqlite3.Connection] = None,
+        batch_size: int = 128,
+    ) -> Iterator[Dict[str, object]]:
+        """Yield meter records one by one, fetching ``batch_size`` rows at a time.
+
+        The connection (when opened here) stays checked out of the pool until
+        the generator is exhausted or closed. Pooled connections may be used
+        from different threads, one at a time, so the generator can be
+        advanced from a threadpool.
+        """
         close_conn = False
         if conn is None:
             conn = get_db_connection()
@@ -1019,11 +1169,9 @@ class MeterLoggingDbQueries:
                 """,
                 params,
             )
-            rows = cursor.fetchall()
-            logger_obj.debug(
-                f"Fetched {len(rows)} meter records (tenant={tenant_id}, meter={meter_id})"
-            )
-            return [dict(row) for row in rows]
+            while rows := cursor.fetchmany(batch_size):
+                for row in rows:
+                    yield dict(row)
         finally:
             if close_conn:
                 conn.close()
@@ -3,14 +3,19 @@
 
 from __future__ import annotations
 
+import json
 import pandas as pd
 import sqlite3
 from collections import defaultdict  # noqa: F401  # Needed when subclasses mix in meter logging queries
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Sequence, cast
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, cast
 from backend.services.core.config import PHILIPPINES_TZ, verify_source_type
 
-from backend.services.data.db_manager.db_schema import get_db_connection
+from backend.services.data.db_manager.db_schema import (
+    REPORT_JOBS_TABLE_SQL,
+    SQL_PARAM_CHUNK_SIZE,
+    get_db_connection,
+)
 from backend.services.core.utils import ReportLogger
 
 
@@ -72,6 +77,8 @@ class ReportingDbQueries:
             close_conn = True
         try:
             cursor = conn.cursor()
+            # Plain tuples: a single int column does not need sqlite3.Row objects.
+            cursor.row_factory = None
             cursor.execute(
                 """
                 SELECT DISTINCT load_id
@@ -80,8 +87,7 @@ class ReportingDbQueries:
                 """,
                 (unit_id,),
             )
-            rows = cursor.fetchall()
-            return [row["load_id"] for row in rows]
+            return [load_id for (load_id,) in cursor]
         finally:
             if close_conn:
                 conn.close()
@@ -148,6 +154,7 @@ class ReportingDbQueries:
             close_conn = True
         try:
             cursor = conn.cursor()
+            cursor.row_factory = None
             cursor.execute(
                 """
                 SELECT DISTINCT ulh.load_id
@@ -162,15 +169,14 @@ class ReportingDbQueries:
                 """,
                 (tenant_id, floor),
             )
-            rows = cursor.fetchall()
-            return [row["load_id"] for row in rows]
+            return [load_id for (load_id,) in cursor]
         finally:
             if close_conn:
                 conn.close()
 
     @staticmethod
     def list_clients(
-        client_ids: Optional[Sequence[int]] = None,
+        client_ids: Optional[Iterable[int]] = None,
         conn: Optional[sqlite3.Connection] = None,
     ) -> List[Dict[str, Any]]:
         """Return active clients filtered by optional identifier list."""
@@ -180,23 +186,24 @@ class ReportingDbQueries:
             close_conn = True
         try:
             cursor = conn.cursor()
-            params: List[Any] = []
-            filtered_ids: Optional[List[int]] = None
+            ids_json: Optional[str] = None
             if client_ids is not None:
                 filtered_ids = [int(client_id) for client_id in client_ids if client_id is not None]
                 if not filtered_ids:
                     return []
-            query = """
+                ids_json = json.dumps(filtered_ids)
+            # One statement for both the filtered and the unfiltered (super
+            # admin) case: a NULL id list disables the filter.
+            cursor.execute(
+                """
                 SELECT id, name
                 FROM clients
                 WHERE is_active = 1
-            """
-            if filtered_ids is not None:
-                placeholders = ",".join("?" * len(filtered_ids))
-                query += f" AND id IN ({placeholders})"
-                params.extend(filtered_ids)
-            query += " ORDER BY name COLLATE NOCASE"
-            cursor.execute(query, params)
+                  AND (?1 IS NULL OR id IN (SELECT value FROM json_each(?1)))
+                ORDER BY name COLLATE NOCASE
+                """,
+                (ids_json,),
+            )
             rows = cursor.fetchall()
             return [{"id": row["id"], "name": row["name"]} for row in rows]
         finally:
@@ -261,6 +268,41 @@ class ReportingDbQueries:
             if close_conn:
                 conn.close()
 
+    @staticmethod
+    def get_client_by_token(
+        client_token: str,
+        conn: Optional[sqlite3.Connection] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Return client row (id, name) by numeric id or case-insensitive name in one query.
+
+        An id match takes precedence over a client whose name happens to be the same digits.
+        """
+        client_id = int(client_token) if client_token.isdigit() else None
+        close_conn = False
+        if conn is None:
+            conn = get_db_connection()
+            close_conn = True
+        try:
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                SELECT id, name
+                FROM clients
+                WHERE is_active = 1
+                  AND (id = ? OR LOWER(name) = LOWER(?))
+                ORDER BY CASE WHEN id = ? THEN 0 ELSE 1 END
+                LIMIT 1
+                """,
+                (client_id, client_token, client_id),
+            )
+            row = cursor.fetchone()
+            if row is None:
+                return None
+            return {"id": row["id"], "name": row["name"]}
+        finally:
+            if close_conn:
+                conn.close()
+
     @staticmethod
     def list_buildings_for_client(
         client_id: int,
@@ -274,24 +316,24 @@ class ReportingDbQueries:
             close_conn = True
         try:
             cursor = conn.cursor()
-            params: List[Any] = [client_id]
-            filtered_ids: Optional[List[int]] = None
+            ids_json: Optional[str] = None
             if building_ids is not None:
                 filtered_ids = [int(building_id) for building_id in building_ids if building_id is not None]
                 if not filtered_ids:
                     return []
-            query = """
+                ids_json = json.dumps(filtered_ids)
+            # A NULL id list disables the building filter (see list_clients).
+            cursor.execute(
+                """
                 SELECT id, name
                 FROM buildings
-                WHERE client_id = ?
+                WHERE client_id = ?1
                   AND is_active = 1
-            """
-            if filtered_ids is not None:
-                placeholders = ",".join("?" * len(filtered_ids))
-                query += f" AND id IN ({placeholders})"
-                params.extend(filtered_ids)
-            query += " ORDER BY name COLLATE NOCASE"
-            cursor.execute(query, params)
+                  AND (?2 IS NULL OR id IN (SELECT value FROM json_each(?2)))
+                ORDER BY name COLLATE NOCASE
+                """,
+                (client_id, ids_json),
+            )
             rows = cursor.fetchall()
             return [{"id": row["id"], "name": row["name"]} for row in rows]
         finally:
@@ -311,23 +353,23 @@ class ReportingDbQueries:
             close_conn = True
         try:
             cursor = conn.cursor()
-            params: List[Any] = [client_id]
-            filtered_ids: Optional[List[int]] = None
+            ids_json: Optional[str] = None
             if tenant_ids is not None:
                 filtered_ids = [int(tenant_id) for tenant_id in tenant_ids if tenant_id is not None]
                 if not filtered_ids:
                     return []
-            query = """
+                ids_json = json.dumps(filtered_ids)
+            # A NULL id list disables the tenant filter (see list_clients).
+            cursor.execute(
+                """
                 SELECT id, name
                 FROM tenants
-                WHERE client_id = ?
-            """
-            if filtered_ids is not None:
-                placeholders = ",".join("?" * len(filtered_ids))
-                query += f" AND id IN ({placeholders})"
-                params.extend(filtered_ids)
-            query += " ORDER BY name COLLATE NOCASE"
-            cursor.execute(query, params)
+                WHERE client_id = ?1
+                  AND (?2 IS NULL OR id IN (SELECT value FROM json_each(?2)))
+                ORDER BY name COLLATE NOCASE
+                """,
+                (client_id, ids_json),
+            )
             rows = cursor.fetchall()
             return [{"id": row["id"], "name": row["name"]} for row in rows]
         finally:
@@ -394,6 +436,41 @@ class ReportingDbQueries:
             if close_conn:
                 conn.close()
 
+    @staticmethod
+    def get_tenant_by_token(
+        client_id: int,
+        tenant_token: str,
+        conn: Optional[sqlite3.Connection] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Return tenant metadata within a client by numeric id or case-insensitive name."""
+        close_conn = False
+        if conn is None:
+            conn = get_db_connection()
+            close_conn = True
+        try:
+            cursor = conn.cursor()
+            if tenant_token.isdigit():
+                match_clause, match_value = "id = ?", int(tenant_token)
+            else:
+                match_clause, match_value = "LOWER(name) = LOWER(?)", tenant_token
+            cursor.execute(
+                f"""
+                SELECT id, client_id, name
+                FROM tenants
+                WHERE client_id = ?
+                  AND {match_clause}
+                LIMIT 1
+                """,
+                (client_id, match_value),
+            )
+            row = cursor.fetchone()
+            if row is None:
+                return None
+            return {"id": row["id"], "client_id": row["client_id"], "name": row["name"]}
+        finally:
+            if close_conn:
+                conn.close()
+
     @staticmethod
     def load_power_data_for_tenant(
         tenant_id: int,
@@ -881,17 +958,49 @@ class ReportingDbQueries:
             conn = get_db_connection()
             close_conn = True
         try:
-            cursor = conn.cursor()
-            cursor.execute(
+            # Keep the SQL text constant: sqlite3 caches the compiled
+            # statement per (pooled) connection, keyed by this exact string.
+            row = conn.execute(
                 "SELECT client_id FROM tenants WHERE id = ? LIMIT 1",
                 (tenant_id,),
-            )
-            row = cursor.fetchone()
+            ).fetchone()
             return row["client_id"] if row else None
         finally:
             if close_conn:
                 conn.close()
 
+    @staticmethod
+    def get_client_ids_for_tenants(
+        tenant_ids: Sequence[int],
+        conn: Optional[sqlite3.Connection] = None,
+    ) -> Dict[int, int]:
+        """Return a ``{tenant_id: client_id}`` mapping for the given tenants in one query."""
+        filtered_ids = sorted({int(tenant_id) for tenant_id in tenant_ids if tenant_id is not None})
+        if not filtered_ids:
+            return {}
+        close_conn = False
+        if conn is None:
+            conn = get_db_connection()
+            close_conn = True
+        try:
+            cursor = conn.cursor()
+            mapping: Dict[int, int] = {}
+            # Chunk to stay under SQLite's host-parameter limit for very large scopes.
+            for start in range(0, len(filtered_ids), SQL_PARAM_CHUNK_SIZE):
+                chunk = filtered_ids[start:start + SQL_PARAM_CHUNK_SIZE]
+                placeholders = ",".join("?" * len(chunk))
+                cursor.execute(
+                    f"SELECT id, client_id FROM tenants WHERE id IN ({placeholders})",
+                    chunk,
+                )
+                for row in cursor.fetchall():
+                    if row["client_id"] is not None:
+                        mapping[row["id"]] = row["client_id"]
+            return mapping
+        finally:
+            if close_conn:
+                conn.close()
+
     @staticmethod
     def get_info_for_user(user_id: int, conn: Optional[sqlite3.Connection] = None) -> Dict[str, Any]:
         """Return the information for a user."""
@@ -937,6 +1046,53 @@ class ReportingDbQueries:
             if close_conn:
                 conn.close()
 
+    @staticmethod
+    def get_user_scope_bundle(user_id: int, conn: Optional[sqlite3.Connection] = None) -> Dict[str, Any]:
+        """Return a user's scope ids plus the client of each assigned tenant, in one query.
+
+        Same ``epc_id`` / ``client_id`` / ``tenant_id`` lists as ``get_info_for_user``,
+        plus ``tenant_client_id``: a ``{tenant_id: client_id}`` mapping.
+        """
+        close_conn = False
+        if conn is None:
+            conn = get_db_connection()
+            close_conn = True
+        try:
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                SELECT e.epc_id AS epc_id, e.client_id AS client_id, e.tenant_id AS tenant_id,
+                       t.client_id AS tenant_client_id
+                FROM entity_user_assignments AS eua
+                JOIN entities AS e ON e.id = eua.entity_id
+                LEFT JOIN tenants AS t ON t.id = e.tenant_id
+                WHERE eua.user_id = ? AND eua.assigned_until IS NULL
+                """,
+                (user_id,),
+            )
+            epc_ids: Set[int] = set()
+            client_ids: Set[int] = set()
+            tenant_client_ids: Dict[int, Optional[int]] = {}
+            for row in cursor.fetchall():
+                if row["epc_id"] is not None:
+                    epc_ids.add(int(row["epc_id"]))
+                if row["client_id"] is not None:
+                    client_ids.add(int(row["client_id"]))
+                if row["tenant_id"] is not None:
+                    tenant_client_id = row["tenant_client_id"]
+                    tenant_client_ids[int(row["tenant_id"])] = (
+                        int(tenant_client_id) if tenant_client_id is not None else None
+                    )
+            return {
+                "epc_id": sorted(epc_ids),
+                "client_id": sorted(client_ids),
+                "tenant_id": sorted(tenant_client_ids),
+                "tenant_client_id": tenant_client_ids,
+            }
+        finally:
+            if close_conn:
+                conn.close()
+
     @staticmethod
     def get_building_id_for_tenant(
         tenant_id: int,
@@ -964,6 +1120,53 @@ class ReportingDbQueries:
                 conn.close()
 
 
+    @staticmethod
+    def get_building_ids_for_tenants(
+        tenant_ids: Iterable[int],
+        client_id: Optional[int] = None,
+        conn: Optional[sqlite3.Connection] = None,
+    ) -> Set[int]:
+        """Return the buildings holding an active unit of any of the given tenants, in one query.
+
+        When ``client_id`` is given, only tenants belonging to that client count.
+        """
+        filtered_ids = sorted({int(tenant_id) for tenant_id in tenant_ids if tenant_id is not None})
+        if not filtered_ids:
+            return set()
+        close_conn = False
+        if conn is None:
+            conn = get_db_connection()
+            close_conn = True
+        try:
+            cursor = conn.cursor()
+            client_join = ""
+            client_params: List[Any] = []
+            if client_id is not None:
+                client_join = "JOIN tenants t ON t.id = uth.tenant_id AND t.client_id = ?"
+                client_params.append(client_id)
+            building_ids: Set[int] = set()
+            # Chunk to stay under SQLite's host-parameter limit for very large scopes.
+            for start in range(0, len(filtered_ids), SQL_PARAM_CHUNK_SIZE):
+                chunk = filtered_ids[start:start + SQL_PARAM_CHUNK_SIZE]
+                placeholders = ",".join("?" * len(chunk))
+                cursor.execute(
+                    f"""
+                    SELECT DISTINCT u.building_id
+                    FROM units u
+                    JOIN unit_tenants_history uth ON u.id = uth.unit_id
+                    {client_join}
+                    WHERE uth.tenant_id IN ({placeholders})
+                      AND uth.is_active = 1
+                      AND u.building_id IS NOT NULL
+                    """,
+                    client_params + chunk,
+                )
+                building_ids.update(row["building_id"] for row in cursor.fetchall())
+            return building_ids
+        finally:
+            if close_conn:
+                conn.close()
+
     @staticmethod
     def get_default_values_for_epc(
         epc_id: int,
@@ -1110,4 +1313,78 @@ class ReportingDbQueries:
             return df
         finally:
             if close_conn:
-                conn.close()
\ No newline at end of file
+                conn.close()
+
+    # ------------------------------------------------------------------
+    # Background report jobs
+    # ------------------------------------------------------------------
+    # The API does not run init_database() on startup, so these helpers create
+    # the report_jobs table on demand (a no-op once it exists).
+
+    @staticmethod
+    def create_report_job(
+        job_id: str,
+        user_id: Optional[int] = None,
+        client_id: Optional[int] = None,
+        conn: Optional[sqlite3.Connection] = None,
+    ) -> None:
+        """Record a newly queued job and drop jobs untouched for a day."""
+        close_conn = False
+        if conn is None:
+            conn = get_db_connection()
+            close_conn = True
+        try:
+            conn.execute(REPORT_JOBS_TABLE_SQL)
+            conn.execute("DELETE FROM report_jobs WHERE updated_at < datetime('now', '-1 day')")
+            conn.execute(
+                "INSERT INTO report_jobs (id, status, user_id, client_id) VALUES (?, 'queued', ?, ?)",
+                (job_id, user_id, client_id),
+            )
+            conn.commit()
+        finally:
+            if close_conn:
+                conn.close()
+
+    @staticmethod
+    def update_report_job_status(
+        job_id: str,
+        status: str,
+        error: Optional[str] = None,
+        conn: Optional[sqlite3.Connection] = None,
+    ) -> None:
+        """Set a job's status ('running', 'finished' or 'failed')."""
+        close_conn = False
+        if conn is None:
+            conn = get_db_connection()
+            close_conn = True
+        try:
+            conn.execute(REPORT_JOBS_TABLE_SQL)
+            conn.execute(
+                "UPDATE report_jobs SET status = ?, error = ?, updated_at = CURRENT_TIMESTAMP WHERE id = ?",
+                (status, error, job_id),
+            )
+            conn.commit()
+        finally:
+            if close_conn:
+                conn.close()
+
+    @staticmethod
+    def get_report_job(
+        job_id: str,
+        conn: Optional[sqlite3.Connection] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Return a job's status, owner and error, or None if unknown or purged."""
+        close_conn = False
+        if conn is None:
+            conn = get_db_connection()
+            close_conn = True
+        try:
+            conn.execute(REPORT_JOBS_TABLE_SQL)
+            row = conn.execute(
+                "SELECT id, status, user_id, client_id, error FROM report_jobs WHERE id = ?",
+                (job_id,),
+            ).fetchone()
+            return dict(row) if row else None
+        finally:
+            if close_conn:
+                conn.close()
@@ -6,6 +6,9 @@ Database schema definitions and initialization.
 import os
 import sqlite3
 from pathlib import Path
+from typing import ContextManager
+
+from .pool import get_pool
 
 DB_MANAGER_DIR = Path(__file__).resolve().parent
 SERVICES_DIR = DB_MANAGER_DIR.parent
@@ -25,10 +28,30 @@ else:
     DB_PATH = _DEFAULT_DB_PATH
 DB_PATH.parent.mkdir(parents=True, exist_ok=True)
 
+# Older SQLite builds cap bound parameters at 999 per statement; batched
+# IN (...) lookups are chunked to stay below it.
+SQL_PARAM_CHUNK_SIZE = 900
+
+
+# Status of background report jobs. Rows are written by the submitting API
+# worker and by the report process running the job, so a status poll can be
+# answered by any API worker.
+REPORT_JOBS_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS report_jobs (
+        id TEXT PRIMARY KEY,
+        status TEXT NOT NULL CHECK(status IN ('queued', 'running', 'finished', 'failed')),
+        user_id INTEGER,
+        client_id INTEGER,
+        error TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+"""
+
+
+def _resolve_db_path() -> Path:
+    """Return the active database path.
 
-def get_db_connection() -> sqlite3.Connection:
-    """Get a database connection with row factory.
-    
     Respects DATABASE_PATH environment variable if set (even if DB_PATH was set differently).
     This ensures production uses the correct database path from environment config.
     """
@@ -37,12 +60,25 @@ def get_db_connection() -> sqlite3.Connection:
     if env_path:
         db_path = Path(env_path)
         db_path.parent.mkdir(parents=True, exist_ok=True)
-    else:
-        db_path = DB_PATH
-    
-    conn = sqlite3.connect(db_path)
-    conn.row_factory = sqlite3.Row
-    return conn
+        return db_path
+    return DB_PATH
+
+
+def get_db_connection() -> sqlite3.Connection:
+    """Get a pooled database connection with row factory.
+
+    ``close()`` returns the connection to the pool (rolling back uncommitted work).
+    """
+    return get_pool(_resolve_db_path()).get()
+
+
+def db_connection() -> ContextManager[sqlite3.Connection]:
+    """Context manager form of ``get_db_connection()``.
+
+    ``with db_connection() as conn:`` returns the connection to the pool on exit
+    (uncommitted work is rolled back).
+    """
+    return get_pool(_resolve_db_path()).acquire()
 
 
 def _table_has_columns(cursor: sqlite3.Cursor, table_name: str, columns: set[str]) -> bool:
@@ -377,6 +413,9 @@ def init_database() -> None:
             )
         """)
         
+        # Background report job status (see REPORT_JOBS_TABLE_SQL)
+        cursor.execute(REPORT_JOBS_TABLE_SQL)
+        
         # 17. Meter Records (Manual meter readings)
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS meter_records (
@@ -401,6 +440,11 @@ def init_database() -> None:
         # Indexes
         # ============================================================================
         
+        # Users indexes (the users listing filters on active / user_group and
+        # orders by name; these let it walk the index instead of sorting)
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_users_active_name ON users(active, last_name, first_name)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_users_active_group_name ON users(active, user_group, last_name, first_name)")
+        
         # Contacts indexes
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_contacts_email ON contacts(email)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_contacts_user_id ON contacts(user_id)")
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Process-local pool of reusable SQLite connections.
+
+``get_db_connection()`` hands out connections from here. Callers keep the
+usual ``conn = get_db_connection() ... conn.close()`` pattern (or
+``with db_connection() as conn:``): ``close()`` on a pooled connection rolls
+back anything left uncommitted and returns it to the pool instead of closing
+the file, so the next request skips ``sqlite3.connect`` and the per-connection
+PRAGMAs, and keeps SQLite's page cache warm.
+"""
+
+from __future__ import annotations
+
+import queue
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Union
+
+PathLike = Union[str, Path]
+
+# Idle connections kept per database; checkouts beyond this open extra
+# connections that are really closed when released.
+DEFAULT_MAX_IDLE = 8
+# Idle connections older than this are closed instead of reused, so a burst
+# does not pin file handles (and stale page caches) for the process lifetime.
+DEFAULT_MAX_IDLE_SECONDS = 300.0
+
+# Compiled statements cached per connection (sqlite3's default is 128). Pooled
+# connections outlive a request, so hot lookups such as the tenant -> client
+# query are prepared once per connection instead of once per request.
+STATEMENT_CACHE_SIZE = 256
+
+# Applied once when a connection is opened. WAL lets readers proceed while a
+# writer commits; NORMAL sync is safe under WAL and avoids an fsync per commit.
+CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",  # 64 MiB page cache
+)
+
+
+class PooledConnection(sqlite3.Connection):
+    """SQLite connection whose ``close()`` releases it back to its pool."""
+
+    _pool: Optional["ConnectionPool"] = None
+    _checked_out: bool = False
+    _released_at: float = 0.0
+
+    def close(self) -> None:
+        pool = self._pool
+        if pool is None:
+            super().close()
+            return
+        pool.release(self)
+
+    def discard(self) -> None:
+        """Close the underlying SQLite handle for good."""
+        self._pool = None
+        self._checked_out = False
+        super().close()
+
+
+class ConnectionPool:
+    """Thread-safe pool of ``sqlite3.Row`` connections to a single database file."""
+
+    def __init__(
+        self,
+        db_path: PathLike,
+        max_idle: int = DEFAULT_MAX_IDLE,
+        max_idle_seconds: float = DEFAULT_MAX_IDLE_SECONDS,
+    ):
+        self.db_path = Path(db_path)
+        self.max_idle = max_idle
+        self.max_idle_seconds = max_idle_seconds
+        # LIFO so the most recently used (warmest) connection is reused first.
+        self._idle: "queue.LifoQueue[PooledConnection]" = queue.LifoQueue()
+
+    def _connect(self) -> PooledConnection:
+        conn = sqlite3.connect(
+            self.db_path,
+            factory=PooledConnection,
+            # Connections move between threadpool workers, but the pool only
+            # ever hands one out to a single caller at a time.
+            check_same_thread=False,
+            cached_statements=STATEMENT_CACHE_SIZE,
+        )
+        conn.row_factory = sqlite3.Row
+        for pragma in CONNECTION_PRAGMAS:
+            try:
+                conn.execute(pragma)
+            except sqlite3.OperationalError:
+                # e.g. journal_mode cannot change while another process holds a
+                # lock; the connection is still usable with the current mode.
+                pass
+        conn._pool = self
+        return conn
+
+    def get(self) -> PooledConnection:
+        """Check out an idle connection, opening a new one if none is available."""
+        cutoff = time.monotonic() - self.max_idle_seconds
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                conn = self._connect()
+                break
+            if conn._released_at >= cutoff:
+                break
+            # Expired: close it and try the next one (LIFO order means the
+            # rest are older still, so this drains them).
+            conn.discard()
+        conn._checked_out = True
+        return conn
+
+    @contextmanager
+    def acquire(self) -> Iterator[PooledConnection]:
+        """Check out a connection for the duration of a ``with`` block."""
+        conn = self.get()
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def release(self, conn: PooledConnection) -> None:
+        """Return ``conn`` to the pool (double releases are ignored)."""
+        if not conn._checked_out:
+            return
+        conn._checked_out = False
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+            # Undo per-caller tweaks so the next borrower gets a clean connection.
+            conn.row_factory = sqlite3.Row
+        except sqlite3.Error:
+            conn.discard()
+            return
+        if self._idle.qsize() >= self.max_idle:
+            conn.discard()
+            return
+        conn._released_at = time.monotonic()
+        self._idle.put_nowait(conn)
+
+    def close_all(self) -> None:
+        """Close every idle connection (checked-out ones close when released)."""
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            conn.discard()
+
+
+_pools: Dict[Path, ConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(db_path: PathLike) -> ConnectionPool:
+    """Return the process-wide pool for ``db_path``, creating it on first use."""
+    path = Path(db_path)
+    pool = _pools.get(path)
+    if pool is None:
+        with _pools_lock:
+            pool = _pools.get(path)
+            if pool is None:
+                pool = _pools[path] = ConnectionPool(path)
+    return pool
+
+
+def close_all_pools() -> None:
+    """Close the idle connections of every pool (e.g. on application shutdown)."""
+    with _pools_lock:
+        pools = list(_pools.values())
+    for pool in pools:
+        pool.close_all()
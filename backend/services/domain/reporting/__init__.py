@@ -311,8 +311,10 @@ def execute_last_records_job(
         else:
             logger.warning(f"⚠️ Failed to send last records email to {user_email}")
             
-    except Exception as exc:  # pragma: no cover - defensive logging
+    except Exception as exc:
         logger.error(f"❌ Error generating last records for client {client_id}: {exc}")
+        # Re-raise so the report pool marks the job as failed.
+        raise
 
 def prepare_billing_df(client_id: int) -> pd.DataFrame:
     """Prepare the billing dataframe for a client."""
@@ -436,8 +438,10 @@ def execute_billing_info_job(
         else:
             logger.warning(f"⚠️ Failed to send billing info email to {user_email}")
             
-    except Exception as exc:  # pragma: no cover - defensive logging
+    except Exception as exc:
         logger.error(f"❌ Error generating billing info for client {client_id}: {exc}")
+        # Re-raise so the report pool marks the job as failed.
+        raise
 
 
 def execute_billing_comparison_job(
@@ -491,6 +495,8 @@ def execute_billing_comparison_job(
             logger.info(f"📬 Billing comparison Smappy email sent to {user_email}")
         else:
             logger.warning(f"⚠️ Failed to send billing comparison Smappy email to {user_email}")
-    except Exception as exc:  # pragma: no cover
+    except Exception as exc:
         logger.error(f"❌ Error generating billing comparison Smappy for client {client_id}: {exc}")
+        # Re-raise so the report pool marks the job as failed.
+        raise
 
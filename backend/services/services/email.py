@@ -5,6 +5,7 @@ Email service for sending reports via AWS SES.
 
 from __future__ import annotations
 
+import base64
 import os
 from pathlib import Path
 from typing import List, Optional
@@ -19,6 +20,19 @@ except ImportError:
 from backend.services.core.utils import ReportLogger
 
 
+# Multiple of 57 raw bytes so every chunk encodes to whole 76-character lines.
+_ATTACHMENT_CHUNK_SIZE = 57 * 1024
+
+
+def _encode_attachment(report_path: Path) -> str:
+    """Base64-encode a file chunk by chunk, wrapped at 76 characters per MIME line."""
+    encoded_chunks: List[str] = []
+    with open(report_path, "rb") as f:
+        while chunk := f.read(_ATTACHMENT_CHUNK_SIZE):
+            encoded_chunks.append(base64.encodebytes(chunk).decode("ascii"))
+    return "".join(encoded_chunks).rstrip("\n")
+
+
 def send_report_email(
     *,
     email: str,
@@ -131,9 +145,6 @@ def send_report_email(
                 logger.warning(f"⚠️ Report file not found: {report_path}")
                 continue
 
-            with open(report_path, "rb") as f:
-                file_data = f.read()
-
             ext = report_path.suffix.lower()
             if ext == ".html":
                 content_type = "text/html"
@@ -145,7 +156,7 @@ def send_report_email(
             encoded_attachments.append(
                 {
                     "name": report_path.name,
-                    "data": file_data,
+                    "data": _encode_attachment(report_path),
                     "content_type": content_type,
                 }
             )
@@ -183,8 +194,6 @@ def send_report_email(
         
         # Add attachments
         for att in encoded_attachments:
-            import base64
-            encoded_data = base64.b64encode(att['data']).decode('utf-8')
             message_parts.extend([
                 "",
                 "--mixed_boundary",
@@ -192,7 +201,7 @@ def send_report_email(
                 "Content-Transfer-Encoding: base64",
                 f"Content-Disposition: attachment; filename=\"{att['name']}\"",
                 "",
-                encoded_data,
+                att['data'],
             ])
         
         message_parts.append("")
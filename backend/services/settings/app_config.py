@@ -37,17 +37,29 @@ class AppConfigManager:
         
         self.settings_file = Path(settings_file)
         self._settings: Optional[Dict[str, Any]] = None
+        self._settings_mtime: Optional[int] = None
     
     def _load_settings(self) -> Dict[str, Any]:
-        """Load settings from JSON file."""
-        if self._settings is None:
-            if not self.settings_file.exists():
-                raise FileNotFoundError(
-                    f"Settings file not found: {self.settings_file}"
-                )
-            
+        """
+        Load settings from JSON file.
+        
+        The parsed settings are kept until the file's modification time
+        changes, so long-lived instances only pay for a ``stat`` per call and
+        still pick up edits made by other instances or processes.
+        """
+        try:
+            mtime = self.settings_file.stat().st_mtime_ns
+        except FileNotFoundError:
+            if self._settings is not None:
+                return self._settings
+            raise FileNotFoundError(
+                f"Settings file not found: {self.settings_file}"
+            )
+        
+        if self._settings is None or mtime != self._settings_mtime:
             with open(self.settings_file, "r", encoding="utf-8") as f:
                 self._settings = json.load(f)
+            self._settings_mtime = mtime
         
         return self._settings
     
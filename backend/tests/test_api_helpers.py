@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""Unit tests for the shared API helper functions."""
+
+from __future__ import annotations
+
+import sys
+from concurrent.futures import Future
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+from fastapi import HTTPException, Request
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from backend.api import api_helpers  # noqa: E402
+from backend.api.api_helpers import (  # noqa: E402
+    _ANON_SCOPE,
+    _get_building_ids_for_tenants_cached,
+    _get_user_scope,
+    UserScope,
+    get_background_job,
+    _normalize_ids,
+    _normalize_timestamp,
+    _normalize_timestamp_str,
+    _resolve_client,
+    invalidate_client_lookups,
+)
+
+
+def test_normalize_ids_handles_mixed_inputs():
+    assert _normalize_ids(None) == []
+    assert _normalize_ids([3, 1]) == [3, 1]
+    assert _normalize_ids(["3", " 4 ", None, "x", 5.0, "-2"]) == [3, 4, 5, -2]
+    assert _normalize_ids("7") == [7]
+    assert _normalize_ids("abc") == []
+    assert _normalize_ids([float("nan"), float("inf"), 2.0, object()]) == [2]
+
+
+def test_normalize_ids_returns_a_copy():
+    source = [1, 2]
+    result = _normalize_ids(source)
+    result.append(3)
+    assert source == [1, 2]
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("2024-10-01 00:00:00", "2024-10-01T00:00:00"),
+        ("2024-10-01T00:00:00+08:00", "2024-10-01T00:00:00+08:00"),
+        ("2024-10-01T00:00:00Z", "2024-10-01T00:00:00+00:00"),
+        ("2024-10-01T00:00:00.000000", "2024-10-01T00:00:00"),
+        ("2024-10-01T00:00:00.123", "2024-10-01T00:00:00.123000"),
+        ("2024-10-01", "2024-10-01T00:00:00"),
+        ("not-a-date", "not-a-date"),
+        ("", None),
+        (None, None),
+        (datetime(2024, 10, 1, tzinfo=timezone.utc), "2024-10-01T00:00:00+00:00"),
+    ],
+)
+def test_normalize_timestamp(value, expected):
+    assert _normalize_timestamp(value) == expected
+
+
+def test_normalize_timestamp_memoizes_repeated_strings():
+    _normalize_timestamp_str.cache_clear()
+    for _ in range(3):
+        assert _normalize_timestamp("2024-10-01 08:00:00.5") == "2024-10-01T08:00:00.500000"
+    info = _normalize_timestamp_str.cache_info()
+    assert (info.hits, info.misses) == (2, 1)
+
+
+def test_resolve_client_caches_hits_only(monkeypatch):
+    calls = []
+
+    def fake_lookup(token):
+        calls.append(token)
+        return {"id": 1, "name": "NEO"} if token == "NEO" else None
+
+    monkeypatch.setattr(api_helpers.DbQueries, "get_client_by_token", staticmethod(fake_lookup))
+    invalidate_client_lookups()
+    assert _resolve_client("NEO") == {"id": 1, "name": "NEO"}
+    assert _resolve_client("NEO") == {"id": 1, "name": "NEO"}
+    for _ in range(2):
+        with pytest.raises(HTTPException):
+            _resolve_client("missing")
+    assert calls == ["NEO", "missing", "missing"]
+
+    invalidate_client_lookups()
+    _resolve_client("NEO")
+    assert calls[-1] == "NEO" and len(calls) == 4
+
+
+def test_anonymous_requests_share_one_scope():
+    scopes = [
+        _get_user_scope(Request({"type": "http", "headers": [], "query_string": b""}))
+        for _ in range(2)
+    ]
+    assert scopes[0] is scopes[1] is _ANON_SCOPE
+
+
+def test_user_scope_ids_are_frozensets(monkeypatch):
+    bundle = {"epc_id": [5], "client_id": [30], "tenant_id": [1, 3], "tenant_client_id": {1: 10, 3: None}}
+    monkeypatch.setattr(
+        api_helpers.DbQueries, "get_user_scope_bundle", staticmethod(lambda user_id: bundle)
+    )
+    api_helpers._USER_INFO_CACHE.pop(7)
+    request = Request({"type": "http", "headers": [(b"x-user-id", b"7")], "query_string": b""})
+    scope = _get_user_scope(request)
+    assert scope.client_ids == frozenset({10, 30}) and isinstance(scope.client_ids, frozenset)
+    assert scope.tenant_ids == frozenset({1, 3}) and isinstance(scope.tenant_ids, frozenset)
+    assert isinstance(scope.epc_ids, frozenset)
+    api_helpers._USER_INFO_CACHE.pop(7)
+    api_helpers._TENANT_CLIENT_CACHE.clear()
+
+
+def test_building_ids_for_tenants_are_cached_per_tenant_set(monkeypatch):
+    calls = []
+
+    def fake_lookup(tenant_ids, client_id=None):
+        calls.append((sorted(tenant_ids), client_id))
+        return {100 + tenant_id for tenant_id in tenant_ids}
+
+    monkeypatch.setattr(api_helpers.DbQueries, "get_building_ids_for_tenants", staticmethod(fake_lookup))
+    invalidate_client_lookups()
+    assert _get_building_ids_for_tenants_cached(frozenset({1, 2}), 10) == {101, 102}
+    assert _get_building_ids_for_tenants_cached(frozenset({2, 1}), 10) == {101, 102}
+    assert _get_building_ids_for_tenants_cached(frozenset({1, 2}), 20) == {101, 102}
+    assert calls == [([1, 2], 10), ([1, 2], 20)]
+    invalidate_client_lookups()
+
+
+def test_background_job_status_is_stored_in_the_database(monkeypatch, tmp_path):
+    monkeypatch.setenv("DATABASE_PATH", str(tmp_path / "jobs.db"))
+    future: Future = Future()
+
+    class FakeExecutor:
+        def submit(self, job, *args, **kwargs):
+            return future
+
+    monkeypatch.setattr(api_helpers, "_get_report_executor", lambda: FakeExecutor())
+    owner = UserScope(user_id=1, epc_ids=frozenset(), client_ids=frozenset({10}), tenant_ids=frozenset())
+    job_id = api_helpers.submit_background_job(print, owner_user_id=1, owner_client_id=10)
+    assert get_background_job(job_id, owner)["status"] == "queued"
+
+    api_helpers._run_background_job(job_id, lambda: None, {})
+    assert get_background_job(job_id, owner)["status"] == "finished"
+
+    with pytest.raises(RuntimeError):
+        api_helpers._run_background_job(job_id, _raise_boom, {})
+    job = get_background_job(job_id, owner)
+    assert (job["status"], job["error"]) == ("failed", "boom")
+
+    # A job that never ran in the pool is marked failed by the done callback.
+    job_id = api_helpers.submit_background_job(print, owner_user_id=1)
+    future.set_exception(RuntimeError("pool broken"))
+    job = get_background_job(job_id, owner)
+    assert (job["status"], job["error"]) == ("failed", "pool broken")
+
+    with pytest.raises(HTTPException) as excinfo:
+        get_background_job("unknown", owner)
+    assert excinfo.value.status_code == 404
+
+
+def test_background_job_is_hidden_from_other_users(monkeypatch, tmp_path):
+    monkeypatch.setenv("DATABASE_PATH", str(tmp_path / "jobs.db"))
+
+    class FakeExecutor:
+        def submit(self, job, *args, **kwargs):
+            return Future()
+
+    monkeypatch.setattr(api_helpers, "_get_report_executor", lambda: FakeExecutor())
+    job_id = api_helpers.submit_background_job(print, owner_user_id=1, owner_client_id=10)
+
+    colleague = UserScope(user_id=2, epc_ids=frozenset(), client_ids=frozenset({10}), tenant_ids=frozenset())
+    stranger = UserScope(user_id=3, epc_ids=frozenset(), client_ids=frozenset({20}), tenant_ids=frozenset())
+    assert get_background_job(job_id, colleague)["status"] == "queued"
+    assert get_background_job(job_id, stranger, unscoped=True)["status"] == "queued"
+    with pytest.raises(HTTPException) as excinfo:
+        get_background_job(job_id, stranger)
+    assert excinfo.value.status_code == 404
+
+
+def test_failing_report_jobs_are_marked_failed(monkeypatch, tmp_path):
+    from backend.services.domain import reporting
+
+    monkeypatch.setenv("DATABASE_PATH", str(tmp_path / "jobs.db"))
+
+    class FakeExecutor:
+        def submit(self, job, *args, **kwargs):
+            return Future()
+
+    monkeypatch.setattr(api_helpers, "_get_report_executor", lambda: FakeExecutor())
+    monkeypatch.setattr(reporting, "generate_report_for_tenant_artifacts", _raise_kwargs_boom)
+    monkeypatch.setattr(api_helpers.DbQueries, "get_last_n_records_for_client", staticmethod(_raise_kwargs_boom))
+    owner = UserScope(user_id=1, epc_ids=frozenset(), client_ids=frozenset(), tenant_ids=frozenset())
+
+    for job, job_kwargs in (
+        (
+            api_helpers._execute_report_job,
+            {
+                "tenant_id": 1, "client_id": 10, "client_name": "Acme", "tenant_name": "T1",
+                "user_email": None, "source": "meter_records", "output_dir": None,
+                "start_date": None, "end_date": None, "month": None, "cutoff_datetime": None,
+            },
+        ),
+        (reporting.execute_last_records_job, {"client_id": 10, "client_name": "Acme", "user_email": "a@b.c"}),
+    ):
+        job_id = api_helpers.submit_background_job(job, owner_user_id=1, **job_kwargs)
+        with pytest.raises(RuntimeError):
+            api_helpers._run_background_job(job_id, job, job_kwargs)
+        job_row = get_background_job(job_id, owner)
+        assert (job_row["status"], job_row["error"]) == ("failed", "boom")
+
+
+def test_anonymous_jobs_are_hidden_from_anonymous_callers(monkeypatch, tmp_path):
+    monkeypatch.setenv("DATABASE_PATH", str(tmp_path / "jobs.db"))
+
+    class FakeExecutor:
+        def submit(self, job, *args, **kwargs):
+            return Future()
+
+    monkeypatch.setattr(api_helpers, "_get_report_executor", lambda: FakeExecutor())
+    job_id = api_helpers.submit_background_job(print)
+    with pytest.raises(HTTPException) as excinfo:
+        get_background_job(job_id, _ANON_SCOPE)
+    assert excinfo.value.status_code == 404
+    assert get_background_job(job_id, _ANON_SCOPE, unscoped=True)["status"] == "queued"
+
+
+def _raise_boom() -> None:
+    raise RuntimeError("boom")
+
+
+def _raise_kwargs_boom(*args, **kwargs) -> None:
+    raise RuntimeError("boom")
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""Unit tests for the reporting route helpers."""
+
+from __future__ import annotations
+
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+from fastapi import HTTPException
+from pydantic import ValidationError
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from backend.api import api_reporting  # noqa: E402
+from backend.api.api_helpers import _ANON_SCOPE  # noqa: E402
+from backend.api.api_reporting import TenantReportRequest, _parse_ph_datetime  # noqa: E402
+from backend.services.core.config import PHILIPPINES_TZ  # noqa: E402
+
+
+def test_parse_ph_datetime_localizes():
+    expected = PHILIPPINES_TZ.localize(datetime(2024, 10, 1, 8, 30))
+    assert _parse_ph_datetime("2024-10-01", "08:30", "start") == expected
+
+
+def test_parse_ph_datetime_requires_both_parts():
+    assert _parse_ph_datetime("2024-10-01", None, "end") is None
+    assert _parse_ph_datetime(None, "08:30", "end") is None
+
+
+@pytest.mark.parametrize("date_str, time_str", [("2024-13-01", "10:00"), ("2024-02-30", "10:00"), ("2024-10-01", "25:00")])
+def test_parse_ph_datetime_rejects_invalid_values(date_str, time_str):
+    with pytest.raises(HTTPException) as excinfo:
+        _parse_ph_datetime(date_str, time_str, "cutoff")
+    assert excinfo.value.status_code == 400
+    assert excinfo.value.detail.startswith("Invalid cutoff_date or cutoff_time format")
+
+
+def test_tenant_report_request_coerces_load_ids():
+    assert TenantReportRequest(tenant_token="A", load_ids=["3", 4.0, 5]).load_ids == [3, 4, 5]
+    for bad in ([None], ["x"], [1.5]):
+        with pytest.raises(ValidationError):
+            TenantReportRequest(tenant_token="A", load_ids=bad)
+
+
+def test_tenant_report_request_checks_date_time_layout():
+    request = TenantReportRequest(tenant_token="A", start_date="2024-10-01", start_time="08:30", end_date="")
+    assert request.end_date == ""
+    for bad in ({"start_date": "2024-1-5"}, {"start_time": "8:30"}, {"cutoff_date": "2024/10/01"}):
+        with pytest.raises(ValidationError):
+            TenantReportRequest(tenant_token="A", **bad)
+
+
+@pytest.mark.parametrize(
+    "fields",
+    [
+        {"cutoff_date": "2024-02-30", "cutoff_time": "10:00"},
+        {"start_date": "2024-10-01", "start_time": "24:00"},
+    ],
+)
+def test_tenant_report_bad_datetimes_are_400(monkeypatch, fields):
+    monkeypatch.setattr(api_reporting, "_resolve_client", lambda token: {"id": 1, "name": "NEO"})
+    monkeypatch.setattr(
+        api_reporting, "_resolve_tenant_for_client", lambda **kwargs: {"id": 2, "name": "Tenant"}
+    )
+    monkeypatch.setattr(api_reporting, "submit_report_job", lambda **kwargs: pytest.fail("job queued"))
+    with pytest.raises(HTTPException) as excinfo:
+        api_reporting.generate_tenant_reports(TenantReportRequest(tenant_token="A", **fields), scope=_ANON_SCOPE)
+    assert excinfo.value.status_code == 400
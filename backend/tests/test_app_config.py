@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""Unit tests for the JSON-backed AppConfigManager."""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from backend.services.settings.app_config import AppConfigManager  # noqa: E402
+
+
+def _write(path: Path, roles: dict, mtime_ns: int) -> None:
+    path.write_text(json.dumps({"roles": roles}), encoding="utf-8")
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_roles_config_is_cached_until_the_file_changes(tmp_path):
+    settings_file = tmp_path / "app_settings.json"
+    _write(settings_file, {"viewer": {"name": "Viewer"}}, 1_000_000_000)
+    manager = AppConfigManager(settings_file)
+    roles = manager.get_roles_config()
+    assert manager.get_roles_config() is roles
+
+    _write(settings_file, {"viewer": {"name": "Reader"}}, 2_000_000_000)
+    assert manager.get_roles_config()["viewer"]["name"] == "Reader"
+
+
+def test_other_instances_see_saved_changes(tmp_path):
+    settings_file = tmp_path / "app_settings.json"
+    _write(settings_file, {"viewer": {"name": "Viewer", "permissions": []}}, 1_000_000_000)
+    reader = AppConfigManager(settings_file)
+    assert reader.get_role_config("viewer")["permissions"] == []
+
+    AppConfigManager(settings_file).update_role_permissions("viewer", ["reports.view"])
+    os.utime(settings_file, ns=(3_000_000_000, 3_000_000_000))
+    assert reader.get_role_config("viewer")["permissions"] == ["reports.view"]
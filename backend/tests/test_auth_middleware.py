@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""Unit tests for the AuthMiddleware user lookup."""
+
+from __future__ import annotations
+
+import inspect
+import sys
+from pathlib import Path
+
+import pytest
+from fastapi import HTTPException, Request
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from backend.middleware import auth_middleware  # noqa: E402
+from backend.middleware.auth_middleware import _lookup_user_auth, invalidate_user_auth  # noqa: E402
+from backend.services.auth.permissions import UserRole, check_permission, require_roles  # noqa: E402
+
+
+def test_user_auth_lookup_is_cached_until_invalidated(tmp_path, monkeypatch):
+    monkeypatch.setenv("DATABASE_PATH", str(tmp_path / "auth.db"))
+    with auth_middleware.db_connection() as conn:
+        conn.execute("CREATE TABLE users (id INTEGER PRIMARY KEY, user_group TEXT, active INTEGER)")
+        conn.execute("INSERT INTO users VALUES (1, 'viewer', 1), (2, 'bogus', 1), (3, 'viewer', 0)")
+        conn.commit()
+    for user_id in (1, 2, 3, 4):
+        invalidate_user_auth(user_id)
+
+    assert _lookup_user_auth(1) == (UserRole.VIEWER, True)
+    assert _lookup_user_auth(2) == (None, True)
+    assert _lookup_user_auth(3) == (None, False)
+    assert _lookup_user_auth(4) == (None, False)
+
+    with auth_middleware.db_connection() as conn:
+        conn.execute("UPDATE users SET active = 0 WHERE id = 1")
+        conn.commit()
+    assert _lookup_user_auth(1) == (UserRole.VIEWER, True)
+    invalidate_user_auth(1)
+    assert _lookup_user_auth(1) == (None, False)
+    invalidate_user_auth(1)
+
+
+def test_check_permission_resolves_templated_and_nested_routes():
+    assert check_permission(UserRole.CLIENT_ADMIN, "/settings/users/12")
+    assert not check_permission(UserRole.CLIENT_MANAGER, "/settings/users/12")
+    # "roles" is not a numeric id, so the roles entry wins over {user_id}.
+    assert check_permission(UserRole.CLIENT_MANAGER, "/settings/users/roles")
+    assert check_permission(UserRole.ENCODER, "/meters/v1/buildings/3/tenants")
+    assert check_permission(UserRole.TENANT_APPROVER, "/meters/v1/approvals/9")
+    assert not check_permission(UserRole.SUPER_ADMIN, "/unmapped")
+    assert not check_permission(None, "/clients")
+
+
+def test_require_roles_keeps_sync_endpoints_sync():
+    @require_roles(UserRole.SUPER_ADMIN)
+    def endpoint(request: Request):
+        return "ok"
+
+    assert not inspect.iscoroutinefunction(endpoint)
+    request = Request({"type": "http", "headers": [], "state": {"user_role": UserRole.SUPER_ADMIN}})
+    assert endpoint(request) == "ok"
+    request.state.user_role = UserRole.VIEWER
+    with pytest.raises(HTTPException) as excinfo:
+        endpoint(request)
+    assert excinfo.value.status_code == 403
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""Unit tests for the in-process TTL cache helper."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from backend.services.core import cache as cache_module  # noqa: E402
+from backend.services.core.cache import TTLCache  # noqa: E402
+
+
+def test_get_or_set_only_computes_once():
+    cache = TTLCache(maxsize=4, ttl=60)
+    calls = []
+
+    def factory():
+        calls.append(1)
+        return {"client_id": [1]}
+
+    assert cache.get_or_set(7, factory) == {"client_id": [1]}
+    assert cache.get_or_set(7, factory) == {"client_id": [1]}
+    assert len(calls) == 1
+
+
+def test_entries_expire(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    cache = TTLCache(maxsize=4, ttl=10)
+    cache.set("a", 1)
+    assert cache.get("a") == 1
+    now[0] += 11
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_lru_eviction_and_none_values():
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set(1, None)
+    cache.set(2, "b")
+    cache.get(1)
+    cache.set(3, "c")
+    assert cache.get_many([1, 2, 3]) == {1: None, 3: "c"}
+    assert cache.pop(1) is None
+    assert cache.get_many([1]) == {}
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""Unit tests for the pooled SQLite connections."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from backend.services.data.db_manager.pool import ConnectionPool  # noqa: E402
+
+
+def test_pool_reuses_released_connections(tmp_path):
+    pool = ConnectionPool(tmp_path / "pool.db", max_idle=1)
+    first = pool.get()
+    first.close()
+    first.close()  # double release is ignored
+    assert pool.get() is first
+    second = pool.get()
+    assert second is not first
+    first.close()
+    second.close()  # pool already holds max_idle connections: really closed
+    assert pool.get() is first
+    pool.close_all()
+
+
+def test_pool_rolls_back_uncommitted_work_on_release(tmp_path):
+    pool = ConnectionPool(tmp_path / "pool.db")
+    conn = pool.get()
+    conn.execute("CREATE TABLE t (x INTEGER)")
+    conn.commit()
+    conn.execute("INSERT INTO t VALUES (1)")
+    conn.row_factory = None
+    conn.close()
+
+    conn = pool.get()
+    assert conn.execute("SELECT COUNT(*) AS n FROM t").fetchone()["n"] == 0
+    conn.close()
+    pool.close_all()
+
+
+def test_pool_closes_connections_idle_past_their_lifetime(tmp_path):
+    pool = ConnectionPool(tmp_path / "pool.db", max_idle_seconds=60)
+    conn = pool.get()
+    conn.close()
+    assert pool.get() is conn
+    conn.close()
+    conn._released_at -= 120
+    fresh = pool.get()
+    assert fresh is not conn and pool._idle.qsize() == 0
+    fresh.close()
+    pool.close_all()
+
+
+def test_pool_acquire_applies_pragmas_and_releases(tmp_path):
+    pool = ConnectionPool(tmp_path / "pool.db")
+    with pool.acquire() as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+    assert pool._idle.qsize() == 1
+    with pool.acquire() as again:
+        assert again is conn
+    pool.close_all()
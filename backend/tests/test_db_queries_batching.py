@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""Unit tests for the batched lookups in the DbQueries mixins."""
+
+from __future__ import annotations
+
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from backend.services.data.db_manager import db_queries_reporting  # noqa: E402
+from backend.services.data.db_manager.db_queries_meter_logging import MeterLoggingDbQueries  # noqa: E402
+from backend.services.data.db_manager.db_queries_reporting import ReportingDbQueries  # noqa: E402
+
+
+@pytest.fixture
+def conn():
+    connection = sqlite3.connect(":memory:")
+    connection.row_factory = sqlite3.Row
+    connection.execute("CREATE TABLE tenants (id INTEGER PRIMARY KEY, client_id INTEGER)")
+    connection.executemany(
+        "INSERT INTO tenants (id, client_id) VALUES (?, ?)",
+        [(1, 10), (2, 10), (3, 20), (4, None)],
+    )
+    connection.execute("CREATE TABLE meters (id INTEGER PRIMARY KEY, meter_id TEXT, meter_ref TEXT)")
+    connection.executemany(
+        "INSERT INTO meters (id, meter_id, meter_ref) VALUES (?, ?, ?)",
+        [(1, "MTR-1", "REF-1"), (2, None, "MTR-2"), (3, "MTR-2", None)],
+    )
+    connection.execute("CREATE TABLE units (id INTEGER PRIMARY KEY, building_id INTEGER)")
+    connection.executemany("INSERT INTO units (id, building_id) VALUES (?, ?)", [(1, 100), (2, 200), (3, 300)])
+    connection.execute("CREATE TABLE unit_tenants_history (unit_id INTEGER, tenant_id INTEGER, is_active INTEGER)")
+    connection.executemany(
+        "INSERT INTO unit_tenants_history (unit_id, tenant_id, is_active) VALUES (?, ?, ?)",
+        [(1, 1, 1), (2, 1, 1), (2, 2, 1), (3, 3, 0)],
+    )
+    connection.execute(
+        "CREATE TABLE entities (id INTEGER PRIMARY KEY, epc_id INTEGER, client_id INTEGER, tenant_id INTEGER)"
+    )
+    connection.executemany(
+        "INSERT INTO entities (id, epc_id, client_id, tenant_id) VALUES (?, ?, ?, ?)",
+        [(1, 5, None, None), (2, None, 30, None), (3, None, None, 1), (4, None, None, 3), (5, None, None, 2)],
+    )
+    connection.execute(
+        "CREATE TABLE entity_user_assignments (user_id INTEGER, entity_id INTEGER, assigned_until TEXT)"
+    )
+    connection.executemany(
+        "INSERT INTO entity_user_assignments (user_id, entity_id, assigned_until) VALUES (?, ?, ?)",
+        [(7, 1, None), (7, 2, None), (7, 3, None), (7, 4, None), (7, 5, "2024-01-01")],
+    )
+    yield connection
+    connection.close()
+
+
+def test_get_client_ids_for_tenants_maps_known_tenants(conn):
+    result = ReportingDbQueries.get_client_ids_for_tenants([3, 1, 1, 4, 99, None], conn=conn)
+    assert result == {1: 10, 3: 20}
+    assert ReportingDbQueries.get_client_ids_for_tenants([], conn=conn) == {}
+
+
+def test_get_client_ids_for_tenants_chunks_large_scopes(conn, monkeypatch):
+    monkeypatch.setattr(db_queries_reporting, "SQL_PARAM_CHUNK_SIZE", 2)
+    result = ReportingDbQueries.get_client_ids_for_tenants([1, 2, 3, 4], conn=conn)
+    assert result == {1: 10, 2: 10, 3: 20}
+
+
+def test_get_user_scope_bundle_joins_tenant_clients(conn):
+    assert ReportingDbQueries.get_user_scope_bundle(7, conn=conn) == {
+        "epc_id": [5],
+        "client_id": [30],
+        "tenant_id": [1, 3],
+        "tenant_client_id": {1: 10, 3: 20},
+    }
+    assert ReportingDbQueries.get_user_scope_bundle(8, conn=conn)["tenant_client_id"] == {}
+
+
+def test_get_building_ids_for_tenants_uses_active_units(conn):
+    assert ReportingDbQueries.get_building_ids_for_tenants([1, 2, 3, 99], conn=conn) == {100, 200}
+    assert ReportingDbQueries.get_building_ids_for_tenants(iter([2]), conn=conn) == {200}
+    assert ReportingDbQueries.get_building_ids_for_tenants([], conn=conn) == set()
+
+
+def test_get_building_ids_for_tenants_filters_by_client(conn):
+    assert ReportingDbQueries.get_building_ids_for_tenants([1, 2, 3], client_id=10, conn=conn) == {100, 200}
+    assert ReportingDbQueries.get_building_ids_for_tenants([2, 3], client_id=20, conn=conn) == set()
+
+
+def test_get_meter_pks_for_identifiers_prefers_meter_id(conn):
+    result = MeterLoggingDbQueries.get_meter_pks_for_identifiers(
+        ["MTR-1", "REF-1", "MTR-2", "NOPE", ""],
+        conn=conn,
+    )
+    assert result == {"MTR-1": 1, "REF-1": 1, "MTR-2": 3}
+
+
+def test_get_client_id_for_tenant(conn):
+    assert ReportingDbQueries.get_client_id_for_tenant(3, conn=conn) == 20
+    assert ReportingDbQueries.get_client_id_for_tenant(99, conn=conn) is None
+
+
+def test_list_clients_filters_with_a_fixed_statement(conn):
+    conn.execute("CREATE TABLE clients (id INTEGER PRIMARY KEY, name TEXT, is_active INTEGER)")
+    conn.executemany(
+        "INSERT INTO clients (id, name, is_active) VALUES (?, ?, ?)",
+        [(10, "beta", 1), (20, "Alpha", 1), (30, "gamma", 0)],
+    )
+    assert [row["id"] for row in ReportingDbQueries.list_clients([10, 20, 30, 99], conn=conn)] == [20, 10]
+    assert [row["id"] for row in ReportingDbQueries.list_clients([10], conn=conn)] == [10]
+    assert ReportingDbQueries.list_clients([], conn=conn) == []
+    assert len(ReportingDbQueries.list_clients(conn=conn)) == 2
+
+
+def test_list_tenants_for_client_intersects_scope_in_sql(conn):
+    conn.execute("ALTER TABLE tenants ADD COLUMN name TEXT")
+    conn.executemany("UPDATE tenants SET name = ? WHERE id = ?", [("b", 1), ("a", 2), ("c", 3)])
+    assert [row["id"] for row in ReportingDbQueries.list_tenants_for_client(10, conn=conn)] == [2, 1]
+    assert [row["id"] for row in ReportingDbQueries.list_tenants_for_client(10, frozenset({1, 3}), conn=conn)] == [1]
+    assert ReportingDbQueries.list_tenants_for_client(20, [1, 2], conn=conn) == []
+
+
+def test_find_load_ids_return_plain_ints(conn):
+    conn.execute("ALTER TABLE units ADD COLUMN floor INTEGER")
+    conn.execute("UPDATE units SET floor = id")
+    conn.execute("CREATE TABLE unit_loads_history (unit_id INTEGER, load_id INTEGER, is_active INTEGER)")
+    conn.executemany(
+        "INSERT INTO unit_loads_history (unit_id, load_id, is_active) VALUES (?, ?, ?)",
+        [(1, 11, 1), (1, 11, 1), (1, 12, 1), (2, 21, 1), (2, 22, 0)],
+    )
+    assert sorted(ReportingDbQueries.find_load_ids_by_unit(1, conn=conn)) == [11, 12]
+    assert ReportingDbQueries.find_load_ids_by_tenant_floor(1, 2, conn=conn) == [21]
+    assert ReportingDbQueries.find_load_ids_by_tenant_floor(3, 3, conn=conn) == []
+    # The connection's own row factory is left alone.
+    assert conn.row_factory is sqlite3.Row
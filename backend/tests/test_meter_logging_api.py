@@ -95,7 +95,7 @@ def api_client(tmp_path, monkeypatch):
     monkeypatch.setattr(db_schema, "DB_PATH", test_db_path)
     init_database()
     seed_meter_logging_data()
-    seeded = MeterLoggingDbQueries.list_tenants_for_client(client_id=1)
+    seeded = MeterLoggingDbQueries.list_tenant_summaries_for_client(client_id=1)
     assert seeded, "Seeding failed to create tenant entries"
     with TestClient(app) as client:
         yield client